@@ -1,5 +1,28 @@
-from .drvschema import *
-from . import converter
+'''
+drvschema
+
+Submodules and the DrvSchema class are imported on first access, so importing
+drvschema does not pull in Django, DRF, NumPy or any optional feature.
+'''
+import importlib
 
 __version__ = '0.0.1'
 
+__all__ = ['DrvSchema', 'diff']
+
+
+def __getattr__(name):
+    if name == 'DrvSchema':
+        from .drvschema import DrvSchema
+        return DrvSchema
+    if name == 'diff':
+        from .schemadiff import diff
+        return diff
+    if not name.startswith('_'):
+        modulename = '%s.%s' % (__name__, name)
+        try:
+            return importlib.import_module(modulename)
+        except ModuleNotFoundError as e:
+            if e.name != modulename:
+                raise
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
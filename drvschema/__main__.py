@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+
+'''
+drvschema command line interface
+
+    python -m drvschema generate --schema myapp.schema:APPSCHEMA \
+        --python myapp/schema_kwargs.py --js frontend/src/validations.js
+
+    python -m drvschema watch --schema schema.yaml --python myapp/schema_kwargs.py
+
+    python -m drvschema export --schema schema.yaml --outdir build/schema --workers 32
+
+    python -m drvschema openapi --schema schema.yaml --output components.json
+
+    python -m drvschema benchmark --sizes 10,1000,100000 --output bench.json
+
+The schema is either a module:attribute reference to a DrvSchema (or a schemata
+dictionary), the path of a JSON or YAML schemata file, or a directory of per-type
+schema files (see drvschema.lazy).
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+import argparse
+import importlib
+import json
+import os
+import sys
+from drvschema import DrvSchema
+from drvschema.generate import Generator
+
+
+def loadAppSchema(spec):
+    """
+    Return a DrvSchema from a module:attribute reference, a JSON or YAML schemata file,
+    or a directory of per-type schema files
+    """
+    if spec.endswith(('.json', '.yaml', '.yml')):
+        return DrvSchema.from_file(spec)
+    if os.path.isdir(spec):
+        return DrvSchema(loader=spec, validate=True)
+
+    if ':' not in spec:
+        raise Exception('Schema %s must be a JSON or YAML file, a directory or a module:attribute reference' % spec)
+
+    modulename, attrname = spec.split(':', 1)
+    schema = getattr(importlib.import_module(modulename), attrname)
+    if isinstance(schema, DrvSchema):
+        return schema
+    return DrvSchema(schema, validate=True)
+
+
+def generate(args):
+    """
+    Write the generated Python kwargs module and / or Vuelidate JavaScript module
+    """
+    if not args.python and not args.js:
+        raise Exception('At least one of --python or --js must be specified')
+
+    generator = Generator(loadAppSchema(args.schema))
+    written = generator.write(args.python, args.js)
+    for path in (args.python, args.js):
+        if path:
+            print('%s %s' % ('Wrote' if path in written else 'Unchanged', path))
+
+
+def watch(args):
+    """
+    Regenerate the outputs of the changed types whenever the schemata file changes
+    """
+    from drvschema.generate import watch
+
+    if not args.python and not args.js:
+        raise Exception('At least one of --python or --js must be specified')
+    if not args.schema.endswith(('.json', '.yaml', '.yml')):
+        raise Exception('watch needs a JSON or YAML schemata file')
+    try:
+        watch(args.schema, args.python, args.js, interval=args.interval, cache_dir=args.cache_dir)
+    except KeyboardInterrupt:
+        pass
+
+
+def export(args):
+    """
+    Write the files of each export target, rendering the types on a process pool
+    """
+    from drvschema.export import export
+
+    targets = args.targets.split(',') if args.targets else None
+    for path in export(loadAppSchema(args.schema), args.outdir, targets=targets, workers=args.workers):
+        print('Wrote %s' % path)
+
+
+def openapi(args):
+    """
+    Write the OpenAPI components object with a JSON Schema for every type
+    """
+    from drvschema.jsonschema import writeComponents
+
+    appschema = loadAppSchema(args.schema)
+    if args.output:
+        with open(args.output, 'w') as f:
+            writeComponents(appschema, f)
+    else:
+        writeComponents(appschema, sys.stdout)
+
+
+def benchmark(args):
+    """
+    Run the benchmark suite and write the JSON report
+    """
+    from drvschema.benchmark import run, writeReport
+
+    report = run([int(size) for size in args.sizes.split(',')])
+    if args.output:
+        writeReport(report, args.output)
+    else:
+        print(json.dumps(report, indent=2))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='drvschema', description='Convert a Cerberus schemata into validation code')
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+
+    generateparser = subparsers.add_parser('generate', help='Write static kwargs and Vuelidate modules')
+    generateparser.add_argument('--schema', required=True, help='module:attribute of a DrvSchema or schemata, or a JSON or YAML schemata file')
+    generateparser.add_argument('--python', help='Path of the generated Python module')
+    generateparser.add_argument('--js', help='Path of the generated Vuelidate JavaScript module')
+    generateparser.set_defaults(func=generate)
+
+    watchparser = subparsers.add_parser('watch', help='Regenerate the changed types whenever the schemata file changes')
+    watchparser.add_argument('--schema', required=True, help='JSON or YAML schemata file')
+    watchparser.add_argument('--python', help='Path of the generated Python module')
+    watchparser.add_argument('--js', help='Path of the generated Vuelidate JavaScript module')
+    watchparser.add_argument('--interval', type=float, default=1.0, help='Seconds between polls of the schemata file')
+    watchparser.add_argument('--cache-dir', help='Compiled schemata cache directory')
+    watchparser.set_defaults(func=watch)
+
+    exportparser = subparsers.add_parser('export', help='Write the files of each target using a process pool')
+    exportparser.add_argument('--schema', required=True, help='module:attribute of a DrvSchema or schemata, or a JSON or YAML schemata file')
+    exportparser.add_argument('--outdir', required=True, help='Directory the target files are written to')
+    exportparser.add_argument('--targets', help='Comma separated targets (django, drf, vuelidate).  Default is all.')
+    exportparser.add_argument('--workers', type=int, help='Number of worker processes.  Default is the number of CPUs.')
+    exportparser.set_defaults(func=export)
+
+    openapiparser = subparsers.add_parser('openapi', help='Write the OpenAPI components (JSON Schema) of every type')
+    openapiparser.add_argument('--schema', required=True, help='module:attribute of a DrvSchema or schemata, or a JSON or YAML schemata file')
+    openapiparser.add_argument('--output', help='Path of the JSON file.  Printed if not given.')
+    openapiparser.set_defaults(func=openapi)
+
+    benchmarkparser = subparsers.add_parser('benchmark', help='Time conversion at different schemata sizes')
+    benchmarkparser.add_argument('--sizes', default='10,1000,10000,100000', help='Comma separated numbers of fields')
+    benchmarkparser.add_argument('--output', help='Path of the JSON report.  Printed if not given.')
+    benchmarkparser.set_defaults(func=benchmark)
+
+    args = parser.parse_args(argv)
+    try:
+        args.func(args)
+    except Exception as e:
+        sys.stderr.write('%s\n' % str(e))
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+
+'''
+drvschema.apps
+
+Django app configuration, used when drvschema is in INSTALLED_APPS to register
+the schema drift system check (see drvschema.checks).
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+from django.apps import AppConfig
+
+
+class DrvSchemaConfig(AppConfig):
+    name = 'drvschema'
+    verbose_name = 'drvschema'
+
+    def ready(self):
+        from drvschema import checks
+
+        checks.register()
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+'''
+drvschema.batch
+
+Asyncio batch validation that keeps the event loop free.
+
+Records are split into chunks that are validated with the type's compiled
+validator (see drvschema.validation) on an executor, and the results of each
+chunk are yielded as soon as it finishes.  At most max_pending chunks are in
+flight, so a large or unbounded (even async) source of records is only read as
+fast as the executor keeps up.
+
+    async for start, results in APPSCHEMA.avalidate_many('User', records, chunk_size=500):
+        valid = [document for document, errors in results if not errors]
+        await save(valid)
+
+start is the position of the chunk's first record in records and results is a
+list of (document, errors) pairs in record order.  Chunks are yielded in the
+order they finish.
+
+The default executor is the event loop's thread pool.  With a
+concurrent.futures.ProcessPoolExecutor the type schema is sent to the workers,
+which compile it once per process; the schema and records must be picklable.
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import os
+import pickle
+from drvschema import converter
+from drvschema.validation import compileValidator
+
+
+# Validators compiled in this (worker) process keyed by (schema digest, allow_unknown)
+COMPILED = {}
+
+
+def validateRecords(check, records):
+    """
+    Return the list of (document, errors) of a compiled validator for each record
+    """
+    return [check(record) for record in records]
+
+
+def validateChunk(schemakey, typeschema, records, allow_unknown=False):
+    """
+    Validate a chunk of records in a worker process, compiling the type schema
+    the first time the process sees it
+    """
+    cachekey = (schemakey, allow_unknown)
+    check = COMPILED.get(cachekey)
+    if check is None:
+        check = COMPILED[cachekey] = compileValidator(typeschema, allow_unknown=allow_unknown)
+
+    return validateRecords(check, records)
+
+
+async def iterChunks(records, chunk_size):
+    """
+    Yield lists of up to chunk_size records from an iterable or async iterable
+    """
+    chunk = []
+    if hasattr(records, '__aiter__'):
+        async for record in records:
+            chunk.append(record)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    else:
+        for record in records:
+            chunk.append(record)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+async def avalidateMany(appschema, typename, records, chunk_size=1000, executor=None, max_pending=None, allow_unknown=False):
+    """
+    Validate records against a type on an executor and yield (start, results) for each
+    chunk as it finishes.  max_pending defaults to twice the number of CPUs.
+    """
+    if chunk_size < 1:
+        raise Exception('chunk_size must be at least 1')
+    if max_pending is None:
+        max_pending = 2 * (os.cpu_count() or 1)
+
+    loop = asyncio.get_running_loop()
+    if isinstance(executor, ProcessPoolExecutor):
+        typeschema = converter.getSchemaFromKeys(appschema.index, typename)
+        schemakey = hashlib.sha256(pickle.dumps(typeschema)).hexdigest()
+
+        def submit(chunk):
+            return loop.run_in_executor(executor, validateChunk, schemakey, typeschema, chunk, allow_unknown)
+    else:
+        check = appschema.compile_validator(typename, allow_unknown=allow_unknown)
+
+        def submit(chunk):
+            return loop.run_in_executor(executor, validateRecords, check, chunk)
+
+    # Start position of each in flight chunk keyed by its future
+    pending = {}
+    start = 0
+    try:
+        async for chunk in iterChunks(records, chunk_size):
+            while len(pending) >= max_pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in sorted(done, key=pending.get):
+                    yield pending.pop(future), future.result()
+            pending[submit(chunk)] = start
+            start += len(chunk)
+
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in sorted(done, key=pending.get):
+                yield pending.pop(future), future.result()
+    finally:
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+
+'''
+drvschema.benchmark
+
+Benchmarks for schema lookups and conversion at realistic schemata sizes.
+
+A synthetic schemata generator builds types of string, boolean, numeric, date
+and datetime fields, plus nested dict fields, for any total number of fields.
+Every converter of the registry that ships with drvschema is timed.  Each benchmark
+is timed over every key of the schemata and the results are returned as a
+dictionary that can be written as JSON and compared between releases.
+
+    python -m drvschema benchmark --sizes 10,1000,100000 --output bench.json
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+import importlib
+import json
+import platform
+import time
+from drvschema import DrvSchema, converter
+
+
+FIELDS_PER_TYPE = 50
+
+# Field converters timed on the fields of each synthetic field type
+FIELD_CONVERTERS = {
+    'string': ('DjangoModelCharFieldKwargs', 'DjangoModelForeignKeyFieldKwargs', 'DRFSerializerCharFieldKwargs'),
+    'boolean': ('DjangoModelBooleanFieldKwargs', 'DRFSerializerBooleanFieldKwargs'),
+    'integer': ('DjangoModelIntegerFieldKwargs', 'DRFSerializerIntegerFieldKwargs'),
+    'float': ('DjangoModelFloatFieldKwargs', 'DRFSerializerFloatFieldKwargs'),
+    'date': ('DjangoModelDateFieldKwargs', 'DRFSerializerDateFieldKwargs'),
+    'datetime': ('DjangoModelDateTimeFieldKwargs', 'DRFSerializerDateTimeFieldKwargs'),
+    'dict': ('DjangoModelJSONFieldKwargs', 'DRFSerializerJSONFieldKwargs'),
+}
+
+# Converters timed on every synthetic type, and the module each one needs
+TYPE_CONVERTERS = (
+    ('VuelidateValidations', None),
+    ('JSONSchema', None),
+    ('DjangoModelMetaKwargs', 'django'),
+)
+
+# Scalar types of the synthetic fields that are neither strings nor booleans
+SCALAR_TYPES = ('integer', 'float', 'date')
+
+
+def syntheticField(i):
+    """
+    Return the schema of the ith synthetic field
+    """
+    kind = i % 10
+    if kind < 5:
+        return {'type': 'string', 'required': kind % 2 == 0, 'maxlength': 50 + i % 200, 'help': 'Field %d' % i}
+    if kind < 6:
+        scalartype = SCALAR_TYPES[(i // 10) % len(SCALAR_TYPES)]
+        if scalartype == 'date':
+            return {'type': 'date', 'help': 'Date %d' % i}
+        return {'type': scalartype, 'min': 0, 'max': 1000 + i % 200, 'help': 'Number %d' % i}
+    if kind < 8:
+        return {'type': 'boolean', 'default': kind == 6, 'help': 'Flag %d' % i}
+    if kind < 9:
+        return {'type': 'datetime', 'readonly': True, 'help': 'Timestamp %d' % i}
+
+    return {
+        'type': 'dict',
+        'help': 'Nested %d' % i,
+        'schema': {
+            'street': {'type': 'string', 'maxlength': 100},
+            'city': {'type': 'string', 'maxlength': 50, 'required': True},
+        },
+    }
+
+
+def syntheticSchemata(nfields, fieldspertype=FIELDS_PER_TYPE):
+    """
+    Return a schemata with nfields fields spread over types of fieldspertype fields
+    """
+    schemata = {}
+    for i in range(nfields):
+        typename = 'Type%d' % (i // fieldspertype)
+        schemata.setdefault(typename, {})['field%d' % i] = syntheticField(i)
+
+    return schemata
+
+
+def syntheticDocument(typeschema):
+    """
+    Return a document with a valid value for every field of a synthetic type
+    """
+    values = {
+        'string': 'x', 'boolean': True, 'integer': 1, 'float': 1.5, 'date': date(2018, 11, 27),
+        'datetime': datetime(2018, 11, 27), 'dict': {'city': 'Cambridge'},
+    }
+    return {field: values[schema['type']] for field, schema in typeschema.items() if not schema.get('readonly')}
+
+
+def timeit(name, nfields, func, keys):
+    """
+    Call func on every key and return a result dictionary for the benchmark
+    """
+    started = time.perf_counter()
+    for key in keys:
+        func(key)
+    seconds = time.perf_counter() - started
+
+    return {
+        'name': name,
+        'fields': nfields,
+        'ops': len(keys),
+        'seconds': seconds,
+        'opsPerSecond': len(keys) / seconds if seconds > 0 else None,
+    }
+
+
+def benchmarkSize(nfields):
+    """
+    Run every benchmark against a synthetic schemata of nfields fields
+    """
+    schemata = syntheticSchemata(nfields)
+    results = []
+
+    started = time.perf_counter()
+    appschema = DrvSchema(schemata)
+    results.append({'name': 'DrvSchema()', 'fields': nfields, 'ops': 1, 'seconds': time.perf_counter() - started})
+
+    fieldkeys = {}
+    nestedkeys = []
+    resolvedkeys = []
+    for typename, typeschema in schemata.items():
+        for field, schema in typeschema.items():
+            fieldkeys.setdefault(schema['type'], []).append('%s.%s' % (typename, field))
+            if 'schema' in schema:
+                nestedkeys.extend('%s.%s.schema.%s' % (typename, field, subfield) for subfield in schema['schema'])
+                resolvedkeys.extend('%s.%s.%s' % (typename, field, subfield) for subfield in schema['schema'])
+    allkeys = [key for keys in fieldkeys.values() for key in keys]
+
+    results.append(timeit('getSchemaFromKeys(schemata)', nfields, lambda key: converter.getSchemaFromKeys(schemata, key), allkeys))
+    results.append(timeit('getSchemaFromKeys(index)', nfields, lambda key: converter.getSchemaFromKeys(appschema.index, key), allkeys))
+    results.append(timeit('getSchemaFromKeys(index, nested)', nfields, lambda key: converter.getSchemaFromKeys(appschema.index, key), nestedkeys))
+    results.append(timeit('getSchemaFromKeys(index, resolved)', nfields, lambda key: converter.getSchemaFromKeys(appschema.index, key), resolvedkeys))
+
+    for fieldtype, convertertypes in FIELD_CONVERTERS.items():
+        for name in convertertypes:
+            keys = fieldkeys.get(fieldtype, [])
+            results.append(timeit('DrvSchema.to(%s)' % name, nfields, lambda key: appschema.to(name, key), keys))
+            results.append(timeit('DrvSchema.to(%s, cached)' % name, nfields, lambda key: appschema.to(name, key), keys))
+
+    typenames = list(schemata.keys())
+    for name, requirement in TYPE_CONVERTERS:
+        if requirement is not None:
+            try:
+                importlib.import_module(requirement)
+            except ImportError:
+                continue
+        results.append(timeit('DrvSchema.to(%s)' % name, nfields, lambda typename: appschema.to(name, typename), typenames))
+
+    try:
+        import cerberus
+    except ImportError:
+        cerberus = None
+    if cerberus is not None:
+        results.extend(benchmarkValidators(appschema, nfields))
+
+    return results
+
+
+def benchmarkValidators(appschema, nfields, nthreads=8, requests=None):
+    """
+    Time validating a document per request on nthreads threads, with a fresh
+    cerberus.Validator per request and with validators from DrvSchema.validator.
+    requests defaults to 10 per type, between 100 and 1000.
+    """
+    import cerberus
+    from drvschema.pool import getCerberusSchema
+
+    typenames = list(appschema.schemata)
+    if requests is None:
+        requests = max(100, min(1000, 10 * len(typenames)))
+    keys = [typenames[i % len(typenames)] for i in range(requests)]
+    documents = {typename: syntheticDocument(appschema.schemata[typename]) for typename in typenames}
+    schemas = {typename: getCerberusSchema(appschema.schemata[typename]) for typename in typenames}
+
+    def fresh(typename):
+        return cerberus.Validator(schemas[typename]).validate(documents[typename])
+
+    def pooled(typename):
+        with appschema.validator(typename) as validator:
+            return validator.validate(documents[typename])
+
+    results = []
+    for name, func in (('cerberus.Validator(fresh)', fresh), ('DrvSchema.validator(pooled)', pooled)):
+        with ThreadPoolExecutor(max_workers=nthreads) as executor:
+            started = time.perf_counter()
+            list(executor.map(func, keys))
+            seconds = time.perf_counter() - started
+        results.append({
+            'name': '%s, %d threads' % (name, nthreads),
+            'fields': nfields,
+            'ops': len(keys),
+            'seconds': seconds,
+            'opsPerSecond': len(keys) / seconds if seconds > 0 else None,
+        })
+
+    return results
+
+
+def run(sizes):
+    """
+    Run the benchmarks for each schemata size and return a JSON serializable report
+    """
+    from drvschema import __version__
+
+    results = []
+    for nfields in sizes:
+        results.extend(benchmarkSize(nfields))
+
+    return {
+        'drvschema': __version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+
+
+def writeReport(report, path):
+    """
+    Write a benchmark report as JSON
+    """
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
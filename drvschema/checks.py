@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+
+'''
+drvschema.checks
+
+Django system check for drift between a DrvSchema and an app's migrations.
+
+The migration state of each configured app is loaded in-process (no database
+and no makemigrations subprocess), and the deconstructed kwargs of each model
+field are compared with those of the field the Django converters would build.
+The check constraints and indexes of DjangoModelMetaKwargs are compared with
+the Meta constraints and indexes of the model the same way, by name.
+Enable it by adding drvschema to INSTALLED_APPS and mapping app labels to
+DrvSchemas (or 'module:attribute' references to them) in the settings
+
+    INSTALLED_APPS = [..., 'drvschema']
+    DRVSCHEMA_CHECKS = {'myapp': 'myapp.schema:APPSCHEMA'}
+
+Types are matched to the app's models by name.  Types without a model in the
+migration state, and model fields that are not in the schema, are not checked.
+Constraints and indexes in the migrations that drvschema did not name (see
+converter.getConstraintName) are not checked either.
+
+    $ ./manage.py check
+    myapp.User.first_name: (drvschema.W001) Field first_name of myapp.User has drifted from the schema: max_length is 100 in the migrations, 200 in the schema.
+    myapp.User: (drvschema.W002) Constraint user_role_1f0e2a9b3c of myapp.User has drifted from the schema: the constraint is not in the migrations.
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+import re
+from drvschema import converter, registry
+
+
+# Marks a kwarg that one side of a comparison does not have
+ABSENT = '<absent>'
+
+# Meta options holding the constraints and indexes of DjangoModelMetaKwargs
+META_OPTIONS = (('constraints', 'constraint'), ('indexes', 'index'))
+
+# Hash suffix of the names made by converter.getConstraintName
+CONSTRAINT_NAME_SUFFIX = re.compile(r'_[0-9a-f]{10}$')
+
+
+def getExpectedFields(appschema, typename):
+    """
+    Return {field: (field class name, deconstructed kwargs)} for the Django model
+    fields the converters build for a type.  Fields of types without a Django
+    field class are skipped.
+    """
+    from django.db import models
+
+    fields = {}
+    for field, schema in converter.getFieldsSchema(appschema.index, typename).items():
+        if not converter.hasFieldClass(schema):
+            continue
+        classname = converter.getFieldClassName(schema)
+        kwargs = appschema.to('DjangoModel%sKwargs' % classname, '%s.%s' % (typename, field), copy=True)
+        name, path, args, deconstructed = getattr(models, classname)(**kwargs).deconstruct()
+        fields[field] = (classname, deconstructed)
+
+    return fields
+
+
+def getStateFields(modelstate):
+    """
+    Return {field: (field class name, deconstructed kwargs)} for a migration ModelState
+    """
+    fields = {}
+    for field, instance in dict(modelstate.fields).items():
+        name, path, args, deconstructed = instance.deconstruct()
+        fields[field] = (path.rsplit('.', 1)[-1], deconstructed)
+
+    return fields
+
+
+def getExpectedOptions(appschema, typename):
+    """
+    Return {option: {name: (class name, deconstructed kwargs)}} for the constraints
+    and indexes DjangoModelMetaKwargs builds for a type
+    """
+    metakwargs = appschema.to('DjangoModelMetaKwargs', typename, copy=True)
+    return {option: getDeconstructed(metakwargs.get(option, ())) for option, label in META_OPTIONS}
+
+
+def getStateOptions(modelstate):
+    """
+    Return {option: {name: (class name, deconstructed kwargs)}} for the constraints
+    and indexes of a migration ModelState
+    """
+    return {option: getDeconstructed(modelstate.options.get(option, ())) for option, label in META_OPTIONS}
+
+
+def getDeconstructed(instances):
+    """
+    Return {name: (class name, deconstructed kwargs)} for a list of constraints or indexes
+    """
+    deconstructed = {}
+    for instance in instances:
+        path, args, kwargs = instance.deconstruct()
+        deconstructed[instance.name] = (path.rsplit('.', 1)[-1], kwargs)
+
+    return deconstructed
+
+
+def describeDifferences(kwargs, actualkwargs):
+    """
+    Return a list describing each kwarg that differs between the schema and the migrations
+    """
+    return [
+        '%s is %r in the migrations, %r in the schema' % (key, actualkwargs.get(key, ABSENT), kwargs.get(key, ABSENT))
+        for key in sorted(set(kwargs) | set(actualkwargs))
+        if kwargs.get(key, ABSENT) != actualkwargs.get(key, ABSENT)
+    ]
+
+
+def compareFields(expected, actual):
+    """
+    Compare expected and actual {field: (class name, kwargs)} dictionaries.
+    Returns a list of (field, description) for each field that differs.
+    """
+    drift = []
+    for field, (classname, kwargs) in expected.items():
+        if field not in actual:
+            drift.append((field, 'the field is not in the migrations'))
+            continue
+        actualclassname, actualkwargs = actual[field]
+        if actualclassname != classname:
+            drift.append((field, 'it is a %s in the migrations, a %s in the schema' % (actualclassname, classname)))
+            continue
+        differences = describeDifferences(kwargs, actualkwargs)
+        if differences:
+            drift.append((field, ', '.join(differences)))
+
+    return drift
+
+
+def compareOptions(expected, actual, prefix=''):
+    """
+    Compare expected and actual {option: {name: (class name, kwargs)}} dictionaries.
+    Returns a list of (label, name, description) for each constraint or index that
+    differs.  Those only in actual are included if their names start with prefix and
+    end with a converter.getConstraintName hash.
+    """
+    drift = []
+    for option, label in META_OPTIONS:
+        expectedbyname = expected.get(option, {})
+        actualbyname = actual.get(option, {})
+        for name, (classname, kwargs) in expectedbyname.items():
+            if name not in actualbyname:
+                drift.append((label, name, 'the %s is not in the migrations' % label))
+                continue
+            actualclassname, actualkwargs = actualbyname[name]
+            if actualclassname != classname:
+                drift.append((label, name, 'it is a %s in the migrations, a %s in the schema' % (actualclassname, classname)))
+                continue
+            differences = describeDifferences(kwargs, actualkwargs)
+            if differences:
+                drift.append((label, name, ', '.join(differences)))
+        for name in actualbyname:
+            if name not in expectedbyname and name.startswith(prefix) and CONSTRAINT_NAME_SUFFIX.search(name):
+                drift.append((label, name, 'the %s is not in the schema' % label))
+
+    return drift
+
+
+def checkDrift(appschema, app_label, state):
+    """
+    Return the list of Django check messages for the types of a DrvSchema that have
+    a model of app_label in a migration ProjectState
+    """
+    from django.core import checks
+
+    messages = []
+    for typename in appschema.schemata:
+        modelstate = state.models.get((app_label, typename.lower()))
+        if modelstate is None:
+            continue
+        expected = getExpectedFields(appschema, typename)
+        for field, description in compareFields(expected, getStateFields(modelstate)):
+            messages.append(checks.Warning(
+                'Field %s of %s.%s has drifted from the schema: %s.' % (field, app_label, typename, description),
+                hint='Run makemigrations for %s, or update the schema.' % app_label,
+                obj='%s.%s.%s' % (app_label, typename, field),
+                id='drvschema.W001',
+            ))
+        prefix = '%.8s_' % typename.lower()
+        for label, name, description in compareOptions(getExpectedOptions(appschema, typename), getStateOptions(modelstate), prefix):
+            messages.append(checks.Warning(
+                '%s %s of %s.%s has drifted from the schema: %s.' % (label.capitalize(), name, app_label, typename, description),
+                hint='Run makemigrations for %s, or update the schema.' % app_label,
+                obj='%s.%s' % (app_label, typename),
+                id='drvschema.W002',
+            ))
+
+    return messages
+
+
+def checkSchemaDrift(app_configs=None, **kwargs):
+    """
+    Django system check comparing the DrvSchemas of DRVSCHEMA_CHECKS with the migration state
+    """
+    from django.conf import settings
+    from django.db.migrations.loader import MigrationLoader
+
+    configured = getattr(settings, 'DRVSCHEMA_CHECKS', None)
+    if not configured:
+        return []
+    if app_configs is not None:
+        labels = {app_config.label for app_config in app_configs}
+        configured = {label: appschema for label, appschema in configured.items() if label in labels}
+        if not configured:
+            return []
+
+    # No connection, so the migration files are read without touching the database
+    state = MigrationLoader(None, ignore_no_migrations=True).project_state()
+    messages = []
+    for app_label, appschema in configured.items():
+        if isinstance(appschema, str):
+            appschema = registry.resolve(appschema)
+        messages.extend(checkDrift(appschema, app_label, state))
+
+    return messages
+
+
+def register():
+    """
+    Register checkSchemaDrift as a Django system check tagged drvschema
+    """
+    from django.core import checks
+
+    checks.register(checkSchemaDrift, 'drvschema')
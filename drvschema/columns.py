@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+'''
+drvschema.columns
+
+Columnar batch validation of a type against NumPy arrays.
+
+Each field's constraints are applied to a whole column at once with vectorized
+operations instead of validating one record dictionary at a time.  The result is
+a dictionary of boolean masks, one per field and failing rule, that are True for
+the rows that fail the rule.
+
+    masks = APPSCHEMA.validate_columns('User', {'first_name': np.array([...])})
+    bad = np.logical_or.reduce([m for rules in masks.values() for m in rules.values()])
+
+Null entries (None or NaN in object and float columns, masked entries in masked
+arrays) are treated like None values in a record.  Rule semantics follow
+drvschema.validation: a null in a non-nullable column without a default fails
+nullable, a missing column fails required and the length rules are skipped for
+empty values when the schema has an empty rule and only apply to values with a
+length.  Every row of a read-only column fails readonly.
+
+NumPy is only imported when this module is used.
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+import numpy as np
+
+
+def _isNull(value):
+    return value is None or value != value
+
+
+def _length(value):
+    return len(value) if hasattr(value, '__len__') else -1
+
+
+def _lessThan(value, constraint):
+    try:
+        return bool(value < constraint)
+    except TypeError:
+        return False
+
+
+def _greaterThan(value, constraint):
+    try:
+        return bool(value > constraint)
+    except TypeError:
+        return False
+
+
+isNull = np.frompyfunc(_isNull, 1, 1)
+length = np.frompyfunc(_length, 1, 1)
+lessThan = np.frompyfunc(_lessThan, 2, 1)
+greaterThan = np.frompyfunc(_greaterThan, 2, 1)
+
+
+def nullMask(column):
+    """
+    Boolean mask of the null entries of a column
+    """
+    if np.ma.isMaskedArray(column):
+        return np.ma.getmaskarray(column) | nullMask(np.ma.getdata(column))
+    if column.dtype.kind == 'f':
+        return np.isnan(column)
+    if column.dtype.kind == 'O':
+        return isNull(column).astype(bool)
+
+    return np.zeros(column.shape, dtype=bool)
+
+
+def lengths(column):
+    """
+    Integer array of the length of each entry of a column of strings or sequences,
+    -1 for entries without a length (e.g. numbers in an object column)
+    """
+    column = np.ma.getdata(column)
+    if column.dtype.kind in ('U', 'S'):
+        return np.char.str_len(column)
+
+    return length(column).astype(np.int64)
+
+
+def validateColumns(typeschema, columns, nrows=None):
+    """
+    Validate a dictionary of column arrays keyed by field name against a type schema.
+
+    Returns a dictionary keyed by field of dictionaries keyed by rule name of boolean
+    row masks.  Only rules that fail for at least one row are included.  nrows is
+    needed when no columns are given.
+    """
+    columns = {field: column if np.ma.isMaskedArray(column) else np.asarray(column) for field, column in columns.items()}
+    if nrows is None:
+        if not columns:
+            raise Exception('nrows must be given when there are no columns')
+        nrows = len(next(iter(columns.values())))
+
+    masks = {}
+    for field in columns:
+        if field not in typeschema:
+            masks[field] = {'unknown': np.ones(nrows, dtype=bool)}
+
+    for field, schema in typeschema.items():
+        fieldmasks = {}
+        if field not in columns:
+            if schema.get('required') and 'default' not in schema:
+                fieldmasks['required'] = np.ones(nrows, dtype=bool)
+            if fieldmasks:
+                masks[field] = fieldmasks
+            continue
+
+        column = columns[field]
+        if len(column) != nrows:
+            raise Exception('Column %s has %d rows, expected %d' % (field, len(column), nrows))
+
+        nulls = nullMask(column)
+        if not schema.get('nullable', False) and 'default' not in schema:
+            fieldmasks['nullable'] = nulls
+        present = ~nulls
+
+        if schema.get('readonly'):
+            # Like a read-only field in a record, every row of the column fails
+            fieldmasks['readonly'] = np.ones(nrows, dtype=bool)
+
+        else:
+            lengthrules = [rule for rule in ('maxlength', 'minlength') if rule in schema]
+            if lengthrules or 'empty' in schema:
+                sizes = lengths(column)
+                # Only entries with a length are checked by the length and empty rules
+                sized = present & (sizes >= 0)
+                if 'empty' in schema:
+                    empties = sized & (sizes == 0)
+                    if not schema['empty']:
+                        fieldmasks['empty'] = empties
+                    present = present & ~empties
+                    sized = sized & ~empties
+                if 'maxlength' in schema:
+                    fieldmasks['maxlength'] = sized & (sizes > schema['maxlength'])
+                if 'minlength' in schema:
+                    fieldmasks['minlength'] = sized & (sizes < schema['minlength'])
+
+            data = np.ma.getdata(column)
+            if 'allowed' in schema:
+                fieldmasks['allowed'] = present & ~np.isin(data, list(schema['allowed']))
+            if data.dtype.kind in ('i', 'u', 'f'):
+                if 'min' in schema:
+                    fieldmasks['min'] = present & (data < schema['min'])
+                if 'max' in schema:
+                    fieldmasks['max'] = present & (data > schema['max'])
+            elif data.dtype.kind == 'O':
+                # Entries that cannot be compared with the constraint pass, as in validation
+                if 'min' in schema:
+                    fieldmasks['min'] = present & lessThan(data, schema['min']).astype(bool)
+                if 'max' in schema:
+                    fieldmasks['max'] = present & greaterThan(data, schema['max']).astype(bool)
+
+        fieldmasks = {rule: mask for rule, mask in fieldmasks.items() if mask.any()}
+        if fieldmasks:
+            masks[field] = fieldmasks
+
+    return masks
@@ -15,49 +15,301 @@ Created on  2018-11-27
 All rights reserved.
 @license: GPL v2.0
 '''
-from collections import defaultdict
-import json
-import re
+from collections.abc import Mapping
+import hashlib
+from drvschema.fieldspec import FieldSpec, MISSING
+
+
+# Field class used by the Django and DRF converters for each Cerberus type.
+# Fields without a type are treated as strings.  Fields of other types (e.g.
+# binary or set), or of several types, have no field class and are skipped wherever a whole type is
+# converted (to_many with a family, build_model, freeze, generate, export and
+# the drift check).
+FIELD_CLASSES = {
+    'string': 'CharField',
+    'boolean': 'BooleanField',
+    'integer': 'IntegerField',
+    'float': 'FloatField',
+    'number': 'FloatField',
+    'datetime': 'DateTimeField',
+    'date': 'DateField',
+    'dict': 'JSONField',
+    'list': 'JSONField',
+}
+
+# Path element that selects the items of a list field or the values of a dict field
+ITEMS_KEY = '[]'
+
+# Rules holding the schema of the values of a dict field (valueschema is the pre-1.3 Cerberus name)
+VALUES_RULES = ('valuesrules', 'valueschema')
+
+
+def isNumber(value):
+    """
+    Return True for int and float values, but not booleans
+    """
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
 
 
-def getSchemaFromKeys(schemata, keystr):
+def getFieldType(schema):
     """
-    Split the key string and retrieve the appropriate data
-    from the schemata by iterating through the key elements in order
+    Return the Cerberus type of the field schema, 'string' if it has none.  A list
+    of one type is that type; None is returned for a list of several types.
+    """
+    fieldtype = schema.get('type', 'string')
+    if isinstance(fieldtype, (list, tuple)) and len(fieldtype) == 1:
+        fieldtype = fieldtype[0]
+    if not isinstance(fieldtype, str):
+        return None
+
+    return fieldtype
+
+
+def hasFieldClass(schema):
+    """
+    Return True if the Cerberus type of the field schema has a Django / DRF field class
+    """
+    return getFieldType(schema) in FIELD_CLASSES
+
+
+def getFieldClassName(schema):
+    """
+    Return the Django / DRF field class name (e.g. CharField) for the Cerberus type of the field schema
+    """
+    fieldtype = getFieldType(schema)
+    if fieldtype not in FIELD_CLASSES:
+        raise Exception('No field class for Cerberus type %s' % schema.get('type', 'string'))
+
+    return FIELD_CLASSES[fieldtype]
+
+
+def getFieldConverterName(family, schema):
+    """
+    Return the name of the converter in a family (e.g. DjangoModel or DRFSerializer)
+    that handles the Cerberus type of the field schema
+    """
+    return '%s%sKwargs' % (family, getFieldClassName(schema))
+
+
+class SchemaIndex(dict):
+    """
+    Flat index of a schemata keyed by dotted path (e.g. 'User.first_name').
+
+    Built once by buildSchemaIndex so that getSchemaFromKeys can do a single
+    dictionary lookup instead of walking the nested schemata.  The original
+    nested schemata is kept on the index as the schemata attribute.
+
+    FieldSpecs are created on first use by getFieldSpec and kept in specs, keyed
+    by the same dotted paths.
+    """
+    def __init__(self, schemata):
+        super().__init__()
+        self.schemata = schemata
+        self.specs = {}
+        # Set by DrvSchema.freeze(); FieldSpecs are no longer added once frozen
+        self.frozen = False
+
+
+def buildSchemaIndex(schemata):
+    """
+    Walk the schemata once and return a SchemaIndex of every nested dictionary
+    keyed by its dotted path
+    """
+    index = SchemaIndex(schemata)
+    indexSchema(index, schemata)
+
+    return index
+
+
+def indexSchema(index, node, path=''):
+    """
+    Add every nested dictionary of node, the schema element at path, to the index
+    """
+    stack = [('%s.' % path if path else '', node)]
+    while stack:
+        prefix, node = stack.pop()
+        for key, value in node.items():
+            if isinstance(value, dict):
+                path = '%s%s' % (prefix, key)
+                index[path] = value
+                stack.append(('%s.' % path, value))
+
+
+def validateSchemata(schemata):
+    """
+    Check that the schemata is a dictionary of types, each of which is a dictionary
+    of field schema dictionaries, and that the rules the converters rely on have
+    sensible values.  Raises an Exception describing the first problem found.
+    """
+    if not isinstance(schemata, dict):
+        raise Exception('Schemata must be a dictionary of types, not %s' % type(schemata).__name__)
+
+    for typename, typeschema in schemata.items():
+        if not isinstance(typeschema, dict):
+            raise Exception('Schema for type %s must be a dictionary of fields' % typename)
+        for field, schema in typeschema.items():
+            if not isinstance(schema, dict):
+                raise Exception('Schema for field %s.%s must be a dictionary of rules' % (typename, field))
+            for rule in ('required', 'nullable', 'readonly', 'unique', 'empty'):
+                if rule in schema and not isinstance(schema[rule], bool):
+                    raise Exception('Rule %s for field %s.%s must be a boolean' % (rule, typename, field))
+            if 'maxlength' in schema and (not isinstance(schema['maxlength'], int) or isinstance(schema['maxlength'], bool)):
+                raise Exception('Rule maxlength for field %s.%s must be an integer' % (typename, field))
+
+
+def getNestedFields(schema):
+    """
+    Return the dictionary of field schemata in the schema rule of a dict field,
+    or None if the field has no nested fields
+    """
+    nested = schema.get('schema')
+    if schema.get('type') == 'list' or not isinstance(nested, dict):
+        return None
+    if not all(isinstance(value, dict) for value in nested.values()):
+        return None
+
+    return nested
+
+
+def getItemsSchema(schema):
+    """
+    Return the schema of the items of a list field or the values of a dict field, or None
+    """
+    if schema.get('type') == 'list' and isinstance(schema.get('schema'), dict):
+        return schema['schema']
+    for rule in VALUES_RULES:
+        if isinstance(schema.get(rule), dict):
+            return schema[rule]
+
+    return None
+
+
+def resolveKeys(schema, keys, depth=0, memo=None, prefix=''):
+    """
+    Iteratively resolve keys from a schema element at depth (0 for the schemata,
+    1 for a type, 2 or more for a field).  Below field level a key selects a field of
+    the nested schema rule of a dict field, [] selects the item or value schema, and
+    any other key is looked up literally (e.g. a rule name).  Each dictionary reached
+    is stored in memo by dotted path.
     """
-    keys = keystr.split('.')
-    schema = schemata
     for key in keys:
-        if key in schema:
+        nested = None
+        if depth > 1 and isinstance(schema, dict):
+            if key == ITEMS_KEY:
+                nested = getItemsSchema(schema)
+            else:
+                fields = getNestedFields(schema)
+                if fields is not None:
+                    nested = fields.get(key)
+        if nested is not None:
+            schema = nested
+        elif isinstance(schema, Mapping) and key in schema:
             schema = schema[key]
         else:
             raise Exception('Key %s from keys %s cannot be found in the schemata.' % (key, ','.join(keys)))
 
+        depth += 1
+        prefix = '%s.%s' % (prefix, key) if prefix else key
+        if memo is not None and isinstance(schema, dict):
+            memo[prefix] = schema
+
     return schema
 
 
+def getSchemaFromKeys(schemata, keystr):
+    """
+    Split the key string and retrieve the appropriate data
+    from the schemata by iterating through the key elements in order.
+
+    Paths can descend into nested schema, e.g. 'Order.address.city' for a dict field
+    and 'Order.items.[].sku' for the items of a list field (see resolveKeys).
+
+    If the schemata is a SchemaIndex the element is looked up directly.  Other keys
+    are resolved from the longest prefix that is in the index, and the dictionaries
+    found on the way are added to the index, unless it is frozen.
+    """
+    if not isinstance(schemata, SchemaIndex):
+        return resolveKeys(schemata, keystr.split('.'))
+
+    if keystr in schemata:
+        return schemata[keystr]
+
+    keys = keystr.split('.')
+    start = len(keys) - 1
+    while start > 0 and '.'.join(keys[:start]) not in schemata:
+        start -= 1
+    if start:
+        prefix = '.'.join(keys[:start])
+        schema = schemata[prefix]
+    else:
+        prefix = ''
+        schema = schemata.schemata
+    memo = None if schemata.frozen else schemata
+
+    return resolveKeys(schema, keys[start:], depth=start, memo=memo, prefix=prefix)
+
+
+def getFieldsSchema(schemata, keystr):
+    """
+    Return the dictionary of field schemata of a type, of a dict field, or of the
+    dict items of a list field (e.g. 'Order', 'Order.address' or 'Order.items.[]')
+    """
+    schema = getSchemaFromKeys(schemata, keystr)
+    if '.' not in keystr:
+        return schema
+
+    fields = getNestedFields(schema)
+    if fields is None:
+        raise Exception('%s does not have nested fields' % keystr)
+    return fields
+
+
+def getFieldSpec(schemata, keystr):
+    """
+    Return the FieldSpec for a field key string.  When schemata is a SchemaIndex
+    the FieldSpec is created once and kept on the index.
+    """
+    if not isinstance(schemata, SchemaIndex):
+        return FieldSpec(getSchemaFromKeys(schemata, keystr))
+
+    spec = schemata.specs.get(keystr)
+    if spec is None:
+        spec = FieldSpec(getSchemaFromKeys(schemata, keystr))
+        if not schemata.frozen:
+            schemata.specs[keystr] = spec
+
+    return spec
+
+
+def getFieldSpecs(schemata, keystr):
+    """
+    Return a list of (field name, FieldSpec) for each field of a type, or of a
+    nested dict field, key string
+    """
+    fields = getFieldsSchema(schemata, keystr)
+    return [(field, getFieldSpec(schemata, '%s.%s' % (keystr, field))) for field in fields]
+
+
 def DjangoModelCharFieldKwargs(schemata, keystr):
     """
     Convert a schema to Django model CharField arguments using schemata and key string
     """
-    schema = getSchemaFromKeys(schemata, keystr)
+    spec = getFieldSpec(schemata, keystr)
     kwargs = {}
 
-    # Map of schema keys to CharField kwarg keys
-    fieldmap = {
-        'maxlength': 'max_length',
-        'help': 'help_text',
-        'default': 'default',
-        'unique': 'unique',
-        'nullable': 'null',
-    }
-
-    for k, v in fieldmap.items():
-        if k in schema:
-            kwargs[v] = schema[k]
-
-    if 'required' in schema:
-        if schema['required']:
+    if spec.maxlength is not MISSING:
+        kwargs['max_length'] = spec.maxlength
+    if spec.help is not MISSING:
+        kwargs['help_text'] = spec.help
+    if spec.default is not MISSING:
+        kwargs['default'] = spec.default
+    if spec.unique is not MISSING:
+        kwargs['unique'] = spec.unique
+    if spec.nullable is not MISSING:
+        kwargs['null'] = spec.nullable
+
+    if spec.required is not MISSING:
+        if spec.required:
             kwargs['default'] = None
             kwargs['null'] = False
         else:
@@ -70,12 +322,12 @@ def DjangoModelForeignKeyFieldKwargs(schemata, keystr):
     """
     Convert a schema to Django model ForeignKey arguments
     """
-    schema = getSchemaFromKeys(schemata, keystr)
+    spec = getFieldSpec(schemata, keystr)
     kwargs = {}
 
-    if 'help' in schema:
-        kwargs['help_text'] = schema['help']
-    if 'required' in schema and not schema['required']:
+    if spec.help is not MISSING:
+        kwargs['help_text'] = spec.help
+    if spec.required is not MISSING and not spec.required:
         kwargs['null'] = True
 
     return kwargs
@@ -85,12 +337,12 @@ def DjangoModelDateTimeFieldKwargs(schemata, keystr):
     """
     Convert a schema to Django model DateTime arguments
     """
-    schema = getSchemaFromKeys(schemata, keystr)
+    spec = getFieldSpec(schemata, keystr)
     kwargs = {}
 
-    if 'help' in schema:
-        kwargs['help_text'] = schema['help']
-    if 'readonly' in schema and schema['readonly']:
+    if spec.help is not MISSING:
+        kwargs['help_text'] = spec.help
+    if spec.readonly:
         kwargs['editable'] = False
 
     return kwargs
@@ -100,38 +352,137 @@ def DjangoModelBooleanFieldKwargs(schemata, keystr):
     """
     Convert a schema to Django model BooleanField arguments
     """
-    schema = getSchemaFromKeys(schemata, keystr)
+    spec = getFieldSpec(schemata, keystr)
     kwargs = {}
 
-    if 'help' in schema:
-        kwargs['help_text'] = schema['help']
-    if 'default' in schema:
-        kwargs['default'] = schema['default']
+    if spec.help is not MISSING:
+        kwargs['help_text'] = spec.help
+    if spec.default is not MISSING:
+        kwargs['default'] = spec.default
+
+    return kwargs
+
+
+def DjangoModelIntegerFieldKwargs(schemata, keystr):
+    """
+    Convert an integer schema to Django model IntegerField arguments
+    """
+    spec = getFieldSpec(schemata, keystr)
+    kwargs = {}
+
+    if spec.help is not MISSING:
+        kwargs['help_text'] = spec.help
+    if spec.default is not MISSING:
+        kwargs['default'] = spec.default
+    if spec.unique is not MISSING:
+        kwargs['unique'] = spec.unique
+    if spec.nullable is not MISSING:
+        kwargs['null'] = spec.nullable
+    if spec.required is not MISSING and not spec.required:
+        kwargs['null'] = True
+    if spec.readonly:
+        kwargs['editable'] = False
 
     return kwargs
 
 
+def DjangoModelFloatFieldKwargs(schemata, keystr):
+    """
+    Convert a float or number schema to Django model FloatField arguments
+    """
+    return DjangoModelIntegerFieldKwargs(schemata, keystr)
+
+
+def DjangoModelDateFieldKwargs(schemata, keystr):
+    """
+    Convert a date schema to Django model DateField arguments
+    """
+    return DjangoModelDateTimeFieldKwargs(schemata, keystr)
+
+
+def DjangoModelJSONFieldKwargs(schemata, keystr):
+    """
+    Convert a dict or list schema to Django model JSONField arguments
+    """
+    spec = getFieldSpec(schemata, keystr)
+    kwargs = {}
+
+    if spec.help is not MISSING:
+        kwargs['help_text'] = spec.help
+    if spec.nullable is not MISSING:
+        kwargs['null'] = spec.nullable
+    if spec.required is not MISSING and not spec.required:
+        kwargs['null'] = True
+
+    return kwargs
+
+
+def getConstraintName(typename, field, rule):
+    """
+    Return a short, stable constraint or index name for a rule of a field.  Django
+    limits index names to 30 characters, so the name is truncated type and field
+    names followed by a hash of the full names and rule.
+    """
+    digest = hashlib.sha256(('%s.%s.%s' % (typename, field, rule)).encode('utf-8')).hexdigest()
+    return '%.8s_%.8s_%s' % (typename.lower(), field, digest[:10])
+
+
+def DjangoModelMetaKwargs(schemata, keystr):
+    """
+    Convert the schema of a type to Django model Meta constraints and indexes.
+
+    Rules of scalar fields become CheckConstraints: empty False (string fields only),
+    allowed, min, max and regex (matched against the whole value).  Fields with an index rule get an Index.
+    """
+    import django
+    from django.db import models
+
+    # CheckConstraint's check argument was renamed to condition in Django 5.1
+    conditionarg = 'condition' if django.VERSION >= (5, 1) else 'check'
+    typename = keystr.rsplit('.', 1)[-1]
+    constraints = []
+    indexes = []
+
+    for field, spec in getFieldSpecs(schemata, keystr):
+        conditions = []
+        if spec.type not in ('dict', 'list'):
+            if spec.empty is False and getFieldType(spec) == 'string':
+                conditions.append(('empty', ~models.Q(**{field: ''})))
+            if spec.allowed is not MISSING:
+                conditions.append(('allowed', models.Q(**{'%s__in' % field: list(spec.allowed)})))
+            if spec.min is not MISSING:
+                conditions.append(('min', models.Q(**{'%s__gte' % field: spec.min})))
+            if spec.max is not MISSING:
+                conditions.append(('max', models.Q(**{'%s__lte' % field: spec.max})))
+            if spec.regex is not MISSING:
+                conditions.append(('regex', models.Q(**{'%s__regex' % field: '^(?:%s)$' % spec.regex})))
+        for rule, condition in conditions:
+            name = getConstraintName(typename, field, rule)
+            constraints.append(models.CheckConstraint(name=name, **{conditionarg: condition}))
+
+        if spec.get('index'):
+            indexes.append(models.Index(fields=[field], name=getConstraintName(typename, field, 'index')))
+
+    return {'constraints': constraints, 'indexes': indexes}
+
+
 def DRFSerializerCharFieldKwargs(schemata, keystr):
     """
     Convert a schema to Django Rest Framework CharField arguments
     """
-    schema = getSchemaFromKeys(schemata, keystr)
+    spec = getFieldSpec(schemata, keystr)
     kwargs = {}
 
-    # Map of schema keys to CharField kwarg keys
-    fieldmap = {
-        'maxlength': 'max_length',
-        'help': 'help_text',
-        'required': 'required',
-        'readonly': 'read_only',
-        'default': 'default',
-    }
-
-    for k, v in fieldmap.items():
-        if k in schema:
-            kwargs[v] = schema[k]
-    if 'read_only' in kwargs and 'required' in kwargs:
-        del kwargs['required']
+    if spec.maxlength is not MISSING:
+        kwargs['max_length'] = spec.maxlength
+    if spec.help is not MISSING:
+        kwargs['help_text'] = spec.help
+    if spec.readonly is not MISSING:
+        kwargs['read_only'] = spec.readonly
+    elif spec.required is not MISSING:
+        kwargs['required'] = spec.required
+    if spec.default is not MISSING:
+        kwargs['default'] = spec.default
 
     return kwargs
 
@@ -140,21 +491,15 @@ def DRFSerializerBooleanFieldKwargs(schemata, keystr):
     """
     Convert a schema to Django Rest Framework BooleanField arguments
     """
-    schema = getSchemaFromKeys(schemata, keystr)
+    spec = getFieldSpec(schemata, keystr)
     kwargs = {}
 
-    # Map of schema keys to BooleanField kwarg keys
-    fieldmap = {
-        'required': 'required',
-        'default': 'default',
-        'readonly': 'read_only',
-    }
-
-    for k, v in fieldmap.items():
-        if k in schema:
-            kwargs[v] = schema[k]
-    if 'read_only' in kwargs and 'required' in kwargs:
-        del kwargs['required']
+    if spec.readonly is not MISSING:
+        kwargs['read_only'] = spec.readonly
+    elif spec.required is not MISSING:
+        kwargs['required'] = spec.required
+    if spec.default is not MISSING:
+        kwargs['default'] = spec.default
 
     return kwargs
 
@@ -163,38 +508,78 @@ def DRFSerializerDateTimeFieldKwargs(schemata, keystr):
     """
     Convert a schema to Django Rest Framework DateTimeField arguments
     """
-    schema = getSchemaFromKeys(schemata, keystr)
+    spec = getFieldSpec(schemata, keystr)
     kwargs = {}
 
-    # Map of schema keys to BooleanField kwarg keys
-    fieldmap = {
-        'readonly': 'read_only',
-    }
+    if spec.readonly is not MISSING:
+        kwargs['read_only'] = spec.readonly
+
+    return kwargs
+
+
+def DRFSerializerIntegerFieldKwargs(schemata, keystr):
+    """
+    Convert an integer schema to Django Rest Framework IntegerField arguments
+    """
+    spec = getFieldSpec(schemata, keystr)
+    kwargs = {}
 
-    for k, v in fieldmap.items():
-        if k in schema:
-            kwargs[v] = schema[k]
+    if spec.help is not MISSING:
+        kwargs['help_text'] = spec.help
+    if spec.readonly is not MISSING:
+        kwargs['read_only'] = spec.readonly
+    elif spec.required is not MISSING:
+        kwargs['required'] = spec.required
+    if spec.default is not MISSING:
+        kwargs['default'] = spec.default
+    if spec.nullable is not MISSING:
+        kwargs['allow_null'] = spec.nullable
+    if isNumber(spec.min):
+        kwargs['min_value'] = spec.min
+    if isNumber(spec.max):
+        kwargs['max_value'] = spec.max
 
     return kwargs
 
 
-def VuelidateValidations(schemata, keystr):
+def DRFSerializerFloatFieldKwargs(schemata, keystr):
     """
-    Convert a schema into Vuelidate validations JSON.
-    Generally this will be done against each type and the results will
-    be pasted into the Vue code.
+    Convert a float or number schema to Django Rest Framework FloatField arguments
+    """
+    return DRFSerializerIntegerFieldKwargs(schemata, keystr)
+
+
+def DRFSerializerDateFieldKwargs(schemata, keystr):
+    """
+    Convert a date schema to Django Rest Framework DateField arguments
+    """
+    return DRFSerializerDateTimeFieldKwargs(schemata, keystr)
+
+
+def DRFSerializerJSONFieldKwargs(schemata, keystr):
     """
-    schemadict = getSchemaFromKeys(schemata, keystr)
-    result = defaultdict(dict)
-    for field, schema in schemadict.items():
-        if 'required' in schema and schema['required']:
-            result[field]['required'] = ''
-        if 'maxlength' in schema:
-            result[field]['maxLength'] = 'maxLength(%d)' % schema['maxlength']
+    Convert a dict or list schema to Django Rest Framework JSONField arguments
+    """
+    spec = getFieldSpec(schemata, keystr)
+    kwargs = {}
+
+    if spec.help is not MISSING:
+        kwargs['help_text'] = spec.help
+    if spec.readonly is not MISSING:
+        kwargs['read_only'] = spec.readonly
+    elif spec.required is not MISSING:
+        kwargs['required'] = spec.required
+
+    return kwargs
 
-    resultstr = json.dumps(result)
 
-    # Strip the quotes from maxLength because it's a function
-    resultstr = re.sub(r'"(maxLength\(\d+\))"', r'\1', resultstr)
+def VuelidateValidations(schemata, keystr):
+    """
+    Convert a schema into a Vuelidate validations object literal.
+    Generally this will be done against each type and the results will
+    be pasted into the Vue code.  Nested dict fields (e.g. 'Order.address') can
+    also be converted on their own.  See drvschema.vuelidate.
+    """
+    from drvschema.vuelidate import getValidations
 
-    return resultstr
+    return getValidations(schemata, keystr)
@@ -39,23 +39,17 @@ class UserSerializer(serializers.ModelSerializer):
     last_name = serializers.CharField(**APPSCHEMA.to('DRFSerializerCharFieldKwargs', 'User.last_name'))
     email = serializers.CharField(**APPSCHEMA.to('DRFSerializerCharFieldKwargs', 'User.email'))
 
+# Or build the classes directly from the schema in one pass
+User = APPSCHEMA.build_model('User')
+UserSerializer = APPSCHEMA.build_serializer('User', model=User)
+
 class UserForm(forms.ModelForm)
     first_name = forms.CharField(**APPSCHEMA.to('DjangoFormCharFieldKwargs', 'User.first_name'))
     last_name = forms.CharField(**APPSCHEMA.to('DjangoFormCharFieldKwargs', 'User.last_name'))
     email = forms.CharField(**APPSCHEMA.to('DjangoFormCharFieldKwargs', 'User.email'))
 
 >>> print(APPSCHEMA.to('VuelidateValidations', 'User'))
-first_name: {
-    required,
-    maxLength: maxLength(200)
-},
-last_name: {
-    required,
-    maxLength: maxLength(200)
-},
-email: {
-    email
-}
+{first_name: {required, maxLength: maxLength(200)}, last_name: {required, maxLength: maxLength(200)}, email: {email}}
 >>>
 
 
@@ -66,7 +60,37 @@ Created on  2018-11-27
 All rights reserved.
 @license: GPL v2.0
 '''
-from drvschema import converter
+from collections import Counter
+from types import MappingProxyType
+import copy as copymodule
+import gc
+import sys
+import time
+from drvschema import converter, registry
+
+
+def freezeResult(result):
+    """
+    Return a read-only version of a converter result: dictionaries become read-only
+    mappings and lists become tuples, recursively
+    """
+    if isinstance(result, dict):
+        return MappingProxyType({key: freezeResult(value) for key, value in result.items()})
+    if isinstance(result, (list, tuple)):
+        return tuple(freezeResult(value) for value in result)
+    return result
+
+
+def copyResult(result):
+    """
+    Return a private, mutable deep copy of a frozen converter result: read-only
+    mappings become dictionaries and tuples become lists
+    """
+    if isinstance(result, MappingProxyType):
+        return {key: copyResult(value) for key, value in result.items()}
+    if isinstance(result, tuple):
+        return [copyResult(value) for value in result]
+    return copymodule.deepcopy(result)
 
 
 class DrvSchema:
@@ -76,31 +100,462 @@ class DrvSchema:
     Uses a Cerberus (https://pypi.org/project/Cerberus/) schema and a set of converters
     that will create arguments or representations for different purposes.
     """
-    def __init__(self, schemata, converters={}):
+    def __init__(self, schemata=None, converters=None, validate=False, index=None, loader=None, max_types=128, typenames=None):
         """
         Takes a list of Cerberus schema dictionaries keyed by class name and field name
+
+        converters is an optional dictionary of converter functions keyed by name that
+        replaces the registered converters (see drvschema.registry).
+
+        The schemata is compiled into a flat index of dotted paths so that lookups
+        do not walk the nested dictionaries.  If validate is True, the schemata is
+        checked up front and an Exception is raised for malformed entries.  index is
+        an already compiled SchemaIndex of the schemata, e.g. loaded from a cache.
+
+        Instead of a schemata, a loader (a directory of per-type schema files or a
+        callable returning the schema of a type) can be given.  Types are then loaded,
+        validated and indexed on first use, and at most max_types of them are kept.
+        typenames lists the types of a callable loader.  See drvschema.lazy.
         """
+        self.lazy = loader is not None
+        if self.lazy:
+            from drvschema.lazy import LazySchemata, LazySchemaIndex
+
+            schemata = LazySchemata(loader, maxsize=max_types, typenames=typenames, validate=validate)
+            schemata.added.append(self._indexType)
+            schemata.evicted.append(self._evictType)
+            index = LazySchemaIndex(schemata)
+        elif validate:
+            converter.validateSchemata(schemata)
         self.schemata = schemata
-        if len(converters) == 0:
-            self.converters = {
-                'DjangoModelCharFieldKwargs': converter.DjangoModelCharFieldKwargs,
-                'DjangoModelBooleanFieldKwargs': converter.DjangoModelBooleanFieldKwargs,
-                'DjangoModelDateTimeFieldKwargs': converter.DjangoModelDateTimeFieldKwargs,
-                'DjangoModelForeignKeyFieldKwargs': converter.DjangoModelForeignKeyFieldKwargs,
-                'DRFSerializerCharFieldKwargs': converter.DRFSerializerCharFieldKwargs,
-                'DRFSerializerBooleanFieldKwargs': converter.DRFSerializerBooleanFieldKwargs,
-                'DRFSerializerDateTimeFieldKwargs': converter.DRFSerializerDateTimeFieldKwargs,
-                'VuelidateValidations': converter.VuelidateValidations,
-            }
-
-    def to(self, converter_name, keystr):
+        self.index = index if index is not None else converter.buildSchemaIndex(schemata)
+
+        # Converter results keyed by (converter name, key string)
+        self.cache = {}
+        self.hits = 0
+        self.misses = 0
+
+        # Compiled record validators keyed by (type name, allow_unknown)
+        self.compiled = {}
+
+        # Cerberus validator pools keyed by (type name, allow_unknown)
+        self.pools = {}
+
+        # Conversion statistics, only collected after instrument() is called
+        self.instrumentation = None
+
+        # Set by freeze()
+        self.frozen = False
+
+        # Converters default to the registry, which imports them on first use
+        if converters:
+            self.converters = dict(converters)
+        else:
+            self.converters = registry.converters
+
+        if self.lazy:
+            self.to = self._lazyTo
+
+    @classmethod
+    def from_file(cls, path, cache_dir=None, converters=None):
+        """
+        Load the schemata from a JSON or YAML file.  If cache_dir is given, the parsed
+        and validated schemata is cached there and reused while the file is unchanged.
+        See drvschema.schemafile.
+        """
+        from drvschema.schemafile import loadSchemaFile
+
+        schemata, index = loadSchemaFile(path, cache_dir=cache_dir)
+        return cls(schemata, converters=converters, index=index)
+
+    def to(self, converter_name, keystr, copy=False):
         """
         Use the specified converter and key string to convert the corresponding schema element
         Converter name must be in the converter list
+
+        Results are cached per instance and returned read-only: dictionaries as read-only
+        mappings and lists as tuples, at every level.  Set copy to True to get a private,
+        mutable deep copy (with dictionaries and lists) instead.
+        """
+        cachekey = (converter_name, keystr)
+        try:
+            result = self.cache[cachekey]
+            self.hits += 1
+        except KeyError:
+            if converter_name not in self.converters:
+                raise Exception('DrvSchema was not initialized with converter %s' % converter_name)
+
+            f = self.converters[converter_name]
+            result = freezeResult(f(self.index, keystr))
+            self.cache[cachekey] = result
+            self.misses += 1
+
+        if copy:
+            return copyResult(result)
+        return result
+
+    def _lazyTo(self, converter_name, keystr, copy=False):
+        """
+        to() used with a loader.  Marks the type as recently used (loading it if
+        needed) so that it is not the next one evicted.
+        """
+        self.schemata.touch(keystr.split('.', 1)[0])
+        return DrvSchema.to(self, converter_name, keystr, copy=copy)
+
+    def _indexType(self, typename, typeschema):
+        """
+        Add a type loaded by the loader to the index
+        """
+        self.index[typename] = typeschema
+        converter.indexSchema(self.index, typeschema, typename)
+
+    def _evictType(self, typename):
+        """
+        Drop the index entries, FieldSpecs and cached results of a type evicted by the loader
+        """
+        prefix = '%s.' % typename
+        index = self.index
+        for keystr in [keystr for keystr in index if keystr == typename or keystr.startswith(prefix)]:
+            del index[keystr]
+        for keystr in [keystr for keystr in index.specs if keystr.startswith(prefix)]:
+            del index.specs[keystr]
+        for cachekey in [cachekey for cachekey in self.cache if cachekey[1] == typename or cachekey[1].startswith(prefix)]:
+            del self.cache[cachekey]
+        for cachekey in [cachekey for cachekey in self.compiled if cachekey[0] == typename]:
+            del self.compiled[cachekey]
+        for cachekey in [cachekey for cachekey in self.pools if cachekey[0] == typename]:
+            del self.pools[cachekey]
+
+    def _frozenTo(self, converter_name, keystr, copy=False):
+        """
+        to() used after freeze().  Reads the precomputed results and never writes to
+        the instance; conversions that were not precomputed are done but not cached.
+        """
+        try:
+            result = self.results[converter_name][keystr]
+        except KeyError:
+            if converter_name not in self.converters:
+                raise Exception('DrvSchema was not initialized with converter %s' % converter_name)
+            result = freezeResult(self.converters[converter_name](self.index, keystr))
+
+        if copy:
+            return copyResult(result)
+        return result
+
+    def freeze(self, families=('DjangoModel', 'DRFSerializer'), gc_freeze=True):
+        """
+        Precompute everything up front for sharing with forked workers (e.g. gunicorn
+        with preload_app): the FieldSpec of every field, the converter family results
+        for every field whose type has a converter, and the Vuelidate validations of
+        every type.  The results are stored in a read-only mapping and to() is replaced
+        by a version that never writes to the instance, so lookups in the workers do
+        not create private copies of the memory pages.
+
+        If gc_freeze is True, gc.freeze() is called so that garbage collections in the
+        workers do not touch the objects created so far either.
+        """
+        if self.frozen:
+            return
+        if self.instrumentation is not None:
+            raise Exception('Cannot freeze an instrumented DrvSchema')
+        if self.lazy:
+            raise Exception('Cannot freeze a DrvSchema with a loader')
+
+        for typename, typeschema in self.schemata.items():
+            for field, schema in typeschema.items():
+                keystr = '%s.%s' % (typename, field)
+                spec = converter.getFieldSpec(self.index, keystr)
+                if converter.hasFieldClass(spec):
+                    for family in families:
+                        self.to(converter.getFieldConverterName(family, spec), keystr)
+            self.to('VuelidateValidations', typename)
+
+        # Results are copied into freshly allocated, string keyed mappings so that
+        # the objects read by lookups are packed together and looking up a key
+        # does not touch (incref) the stored keys
+        results = {}
+        for (converter_name, keystr), result in self.cache.items():
+            if isinstance(result, MappingProxyType):
+                result = MappingProxyType(dict(result))
+            results.setdefault(converter_name, {})[keystr] = result
+        self.results = MappingProxyType({name: MappingProxyType(byname) for name, byname in results.items()})
+        self.cache = MappingProxyType(self.cache)
+        self.index.frozen = True
+        self.to = self._frozenTo
+        self.frozen = True
+
+        if gc_freeze:
+            gc.freeze()
+
+    def to_many(self, converter_name, typename, copy=False):
+        """
+        Convert every field of a type and return a dictionary of results keyed by field name
+
+        converter_name is either a field converter (e.g. DjangoModelCharFieldKwargs), which is
+        applied to every field, or a converter family (DjangoModel or DRFSerializer), in which
+        case the converter for each field is chosen from its Cerberus type and fields of
+        types without a field class (see converter.FIELD_CLASSES) are skipped.  typename can
+        also be the path of a nested dict field (e.g. Order.address or Order.items.[]).
+        copy is passed on to to().
+        """
+        fields = converter.getFieldsSchema(self.index, typename)
+        results = {}
+        for field, schema in fields.items():
+            name = converter_name
+            if name not in self.converters:
+                if not converter.hasFieldClass(schema):
+                    continue
+                name = converter.getFieldConverterName(converter_name, schema)
+            results[field] = self.to(name, '%s.%s' % (typename, field), copy=copy)
+
+        return results
+
+    def convert_all(self, converter_name):
+        """
+        Convert every field of every type in the schemata.
+        Returns a dictionary of to_many results keyed by type name.
+        """
+        return {typename: self.to_many(converter_name, typename) for typename in self.schemata}
+
+    def build_model(self, typename, base=None, meta=None, module=None):
+        """
+        Create a Django model class for a type with one field per schema field.
+
+        base defaults to django.db.models.Model.  meta is an optional dictionary of
+        Meta attributes (e.g. app_label).  The check constraints and indexes from
+        DjangoModelMetaKwargs are added unless meta sets constraints or indexes.
+        module defaults to the caller's module so that Django can work out the app
+        the model belongs to.
         """
-        if converter_name not in self.converters:
-            raise Exception('DrvSchema was not initialized with converter %s' % converter_name)
+        from django.db import models
 
-        f = self.converters[converter_name]
+        if base is None:
+            base = models.Model
+        if module is None:
+            module = sys._getframe(1).f_globals.get('__name__')
 
-        return f(self.schemata, keystr)
+        attrs = self._buildFields(typename, 'DjangoModel', models)
+        attrs['__module__'] = module
+        metaattrs = {key: value for key, value in self.to('DjangoModelMetaKwargs', typename, copy=True).items() if value}
+        if meta:
+            metaattrs.update(meta)
+        if metaattrs:
+            attrs['Meta'] = type('Meta', (), dict(metaattrs, __module__=module))
+
+        return type(typename, (base,), attrs)
+
+    def build_serializer(self, typename, base=None, model=None, meta=None, module=None):
+        """
+        Create a Django Rest Framework serializer class for a type with one field per schema field.
+
+        If a model is given, the serializer is a ModelSerializer for it and Meta.fields
+        lists the schema fields; otherwise base defaults to serializers.Serializer.
+        """
+        from rest_framework import serializers
+
+        if base is None:
+            base = serializers.ModelSerializer if model is not None else serializers.Serializer
+        if module is None:
+            module = sys._getframe(1).f_globals.get('__name__')
+
+        attrs = self._buildFields(typename, 'DRFSerializer', serializers)
+        metaattrs = {}
+        if model is not None:
+            metaattrs['model'] = model
+            metaattrs['fields'] = tuple(attrs.keys())
+        if meta:
+            metaattrs.update(meta)
+        attrs['__module__'] = module
+        if metaattrs:
+            metaattrs['__module__'] = module
+            attrs['Meta'] = type('Meta', (), metaattrs)
+
+        return type('%sSerializer' % typename, (base,), attrs)
+
+    def _buildFields(self, typename, family, fieldmodule):
+        """
+        Instantiate the field class from fieldmodule (django.db.models or rest_framework.serializers)
+        for every field of the type, in one pass over the index
+        """
+        typeschema = converter.getSchemaFromKeys(self.index, typename)
+        fields = {}
+        for field, schema in typeschema.items():
+            if not converter.hasFieldClass(schema):
+                continue
+            fieldclass = converter.getFieldClassName(schema)
+            kwargs = self.to('%s%sKwargs' % (family, fieldclass), '%s.%s' % (typename, field), copy=True)
+            fields[field] = getattr(fieldmodule, fieldclass)(**kwargs)
+
+        return fields
+
+    def compile_validator(self, typename, allow_unknown=False):
+        """
+        Return a CompiledValidator for a type.  Calling it with a record returns the
+        normalized record and a Cerberus style dictionary of errors.
+        """
+        cachekey = (typename, allow_unknown)
+        if cachekey not in self.compiled:
+            from drvschema.validation import compileValidator
+
+            typeschema = converter.getSchemaFromKeys(self.index, typename)
+            self.compiled[cachekey] = compileValidator(typeschema, allow_unknown=allow_unknown)
+
+        return self.compiled[cachekey]
+
+    def avalidate_many(self, typename, records, chunk_size=1000, executor=None, max_pending=None, allow_unknown=False):
+        """
+        Return an async generator that validates records (an iterable or async iterable)
+        in chunks on an executor (default: the event loop's thread pool) and yields
+        (start, [(document, errors), ...]) for each chunk as it finishes, with at most
+        max_pending chunks in flight.  See drvschema.batch.
+
+            async for start, results in APPSCHEMA.avalidate_many('User', records):
+                ...
+        """
+        from drvschema.batch import avalidateMany
+
+        return avalidateMany(
+            self, typename, records, chunk_size=chunk_size, executor=executor,
+            max_pending=max_pending, allow_unknown=allow_unknown,
+        )
+
+    def validator(self, typename, allow_unknown=False):
+        """
+        Return a context manager that leases a cerberus.Validator for a type from
+        a thread-safe pool.  The schema is compiled once per type, and validators
+        are reset and returned to the pool on exit.  Requires Cerberus.
+
+            with APPSCHEMA.validator('User') as validator:
+                validator.validate(document)
+        """
+        cachekey = (typename, allow_unknown)
+        pool = self.pools.get(cachekey)
+        if pool is None:
+            from drvschema.pool import ValidatorPool
+
+            typeschema = converter.getSchemaFromKeys(self.index, typename)
+            pool = self.pools.setdefault(cachekey, ValidatorPool(typeschema, allow_unknown=allow_unknown))
+
+        return pool.lease()
+
+    def validate_columns(self, typename, columns, nrows=None):
+        """
+        Validate a dictionary of NumPy column arrays keyed by field name against a type.
+
+        Returns a dictionary of per-row boolean error masks keyed by field and rule name;
+        see drvschema.columns.  Requires NumPy.
+        """
+        from drvschema.columns import validateColumns
+
+        typeschema = converter.getSchemaFromKeys(self.index, typename)
+        return validateColumns(typeschema, columns, nrows=nrows)
+
+    def instrument(self, enabled=True, hook=None):
+        """
+        Start (or stop) collecting conversion statistics for stats().
+
+        While enabled, to() is replaced on the instance by a timed wrapper, so there
+        is no overhead when instrumentation is off.  If hook is given it is called
+        after every conversion with (converter_name, keystr, elapsed seconds, cache hit).
+        """
+        if self.frozen:
+            raise Exception('Cannot instrument a frozen DrvSchema')
+        if not enabled:
+            self.__dict__.pop('to', None)
+            if self.lazy:
+                self.to = self._lazyTo
+            self.instrumentation = None
+            return
+
+        self.instrumentation = {
+            'converters': {},
+            'keys': Counter(),
+            'hook': hook,
+        }
+        self.to = self._instrumentedTo
+
+    def _instrumentedTo(self, converter_name, keystr, copy=False):
+        """
+        to() wrapper that records timing and call counts
+        """
+        hit = (converter_name, keystr) in self.cache
+        started = time.perf_counter()
+        if self.lazy:
+            result = self._lazyTo(converter_name, keystr, copy=copy)
+        else:
+            result = DrvSchema.to(self, converter_name, keystr, copy=copy)
+        elapsed = time.perf_counter() - started
+
+        instrumentation = self.instrumentation
+        stats = instrumentation['converters'].get(converter_name)
+        if stats is None:
+            stats = instrumentation['converters'][converter_name] = {'calls': 0, 'hits': 0, 'misses': 0, 'total': 0.0, 'max': 0.0, 'convert': 0.0}
+        stats['calls'] += 1
+        stats['total'] += elapsed
+        if elapsed > stats['max']:
+            stats['max'] = elapsed
+        if hit:
+            stats['hits'] += 1
+        else:
+            # Time spent in the converter function itself
+            stats['misses'] += 1
+            stats['convert'] += elapsed
+        instrumentation['keys'][(converter_name, keystr)] += 1
+
+        if instrumentation['hook'] is not None:
+            instrumentation['hook'](converter_name, keystr, elapsed, hit)
+
+        return result
+
+    def stats(self, top=10):
+        """
+        Return the conversion statistics collected since instrument() was called.
+
+        converters maps each converter name to its call, cache hit and miss counts and
+        its cumulative (total), slowest (max) and converter function (convert) times in
+        seconds.  hotKeys lists the top (converter name, key string, count) pairs that
+        were requested more than once.
+        """
+        if self.instrumentation is None:
+            raise Exception('DrvSchema instrumentation is not enabled; call instrument() first')
+
+        return {
+            'converters': {name: dict(stats) for name, stats in self.instrumentation['converters'].items()},
+            'hotKeys': [
+                (converter_name, keystr, count)
+                for (converter_name, keystr), count in self.instrumentation['keys'].most_common(top) if count > 1
+            ],
+            'cache': self.cacheInfo(),
+        }
+
+    def invalidate(self):
+        """
+        Drop cached converter results and rebuild the index.
+        Must be called after the schemata is mutated.  With a loader, every type is
+        reloaded on next use.  A frozen DrvSchema cannot be invalidated.
+        """
+        if self.frozen:
+            raise Exception('Cannot invalidate a frozen DrvSchema')
+        if self.lazy:
+            from drvschema.lazy import LazySchemaIndex
+
+            # Types are reloaded from the loader on next use
+            self.schemata.clear()
+            self.index = LazySchemaIndex(self.schemata)
+        else:
+            self.index = converter.buildSchemaIndex(self.schemata)
+        self.cache.clear()
+        self.compiled.clear()
+        self.pools.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def cacheInfo(self):
+        """
+        Return a dictionary of converter result cache hits, misses and size
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self.cache),
+        }
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+'''
+drvschema.export
+
+Parallel export of the generated artifacts for every target.
+
+Types are rendered in batches on a concurrent.futures process pool and the
+rendered chunks are merged back in schemata order, so the files are byte for
+byte the same as the ones rendered serially (workers=1).
+
+    python -m drvschema export --schema schema.yaml --outdir build/schema --workers 32
+
+Each worker builds its own DrvSchema from the schemata with the registered
+converters, so the schemata must be picklable.
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+from concurrent.futures import ProcessPoolExecutor
+import os
+import pickle
+from drvschema import registry
+from drvschema.generate import Generator, writeIfChanged
+
+
+# Target name mapped to the output file name and, for Python targets, the generated constant
+TARGETS = {
+    'django': ('django_kwargs.py', 'DJANGO_MODEL_KWARGS'),
+    'drf': ('drf_kwargs.py', 'DRF_SERIALIZER_KWARGS'),
+    'vuelidate': ('vuelidate.js', None),
+}
+
+# Batches per worker, so that slow types do not leave workers idle
+BATCHES_PER_WORKER = 4
+
+# Generator of the worker process, set by initWorker
+workerGenerator = None
+
+
+def initWorker(schemata, converters=None):
+    """
+    Process pool initializer that builds the worker's DrvSchema once, with the
+    converters of the caller's DrvSchema (None for the registry)
+    """
+    global workerGenerator
+    from drvschema import DrvSchema
+
+    workerGenerator = Generator(DrvSchema(schemata, converters=converters))
+
+
+def getWorkerConverters(appschema):
+    """
+    Return the converters to send to the workers for a DrvSchema: None if it uses
+    the registry, its converters dictionary if that can be pickled, and False if not
+    """
+    if appschema.converters is registry.converters:
+        return None
+    try:
+        pickle.dumps(appschema.converters)
+    except Exception:
+        return False
+
+    return appschema.converters
+
+
+def renderTypes(typenames):
+    """
+    Render a batch of types in a worker process
+    """
+    return [(typename, workerGenerator.renderType(typename)) for typename in typenames]
+
+
+def renderAll(appschema, workers=None):
+    """
+    Return a Generator for the DrvSchema with the chunks of every type rendered,
+    using a pool of workers processes (default: the number of CPUs).  The workers
+    use the DrvSchema's converters; if they cannot be pickled (e.g. lambdas), the
+    types are rendered in this process instead.
+    """
+    generator = Generator(appschema)
+    typenames = list(appschema.schemata)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = min(workers, len(typenames))
+    converters = getWorkerConverters(appschema) if workers > 1 else None
+    if converters is False:
+        workers = 1
+
+    if workers <= 1:
+        for typename in typenames:
+            generator.getChunks(typename)
+        return generator
+
+    nbatches = workers * BATCHES_PER_WORKER
+    batches = [typenames[i::nbatches] for i in range(nbatches)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=initWorker, initargs=(appschema.schemata, converters)) as executor:
+        for results in executor.map(renderTypes, [batch for batch in batches if batch]):
+            generator.chunks.update(results)
+
+    return generator
+
+
+def export(appschema, outdir, targets=None, workers=None):
+    """
+    Write the files of each target (default: all TARGETS) to outdir.
+    Returns the list of paths that were actually rewritten.
+    """
+    if targets is None:
+        targets = list(TARGETS)
+    for target in targets:
+        if target not in TARGETS:
+            raise Exception('Unknown export target %s' % target)
+
+    generator = renderAll(appschema, workers=workers)
+    os.makedirs(outdir, exist_ok=True)
+    written = []
+    for target in targets:
+        filename, constant = TARGETS[target]
+        path = os.path.join(outdir, filename)
+        if constant is None:
+            changed = writeIfChanged(path, generator.jsSource(), comment='//')
+        else:
+            changed = writeIfChanged(path, generator.pythonSource(constants=(constant,)))
+        if changed:
+            written.append(path)
+
+    return written
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+'''
+drvschema.fieldspec
+
+Compact, immutable representation of a field schema.
+
+A FieldSpec normalizes the rules the converters read into typed __slots__
+attributes, so converters read attributes instead of probing the rule dictionary
+and building lookup dictionaries on every call.  Rules that are not set are
+MISSING (None is a meaningful value for e.g. default).  The original rule
+dictionary of the schemata stays available as the rules attribute; it is a
+reference, not a copy.
+
+    spec = FieldSpec({'type': 'string', 'maxlength': 200})
+    spec.maxlength   # 200
+    spec.required    # MISSING
+    spec.rules       # {'type': 'string', 'maxlength': 200}
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+
+
+class Missing:
+    """
+    Type of the MISSING sentinel for rules that are not set
+    """
+    __slots__ = ()
+
+    def __repr__(self):
+        return 'MISSING'
+
+    def __bool__(self):
+        return False
+
+    def __reduce__(self):
+        return 'MISSING'
+
+
+MISSING = Missing()
+
+# Rules that are normalized into FieldSpec attributes
+ATTRIBUTES = (
+    'type', 'required', 'nullable', 'readonly', 'empty', 'unique', 'default', 'help',
+    'maxlength', 'minlength', 'min', 'max', 'regex', 'allowed', 'schema',
+)
+
+
+class FieldSpec:
+    """
+    Frozen field schema with one attribute per rule in ATTRIBUTES
+    """
+    __slots__ = ATTRIBUTES + ('rules',)
+
+    def __init__(self, rules):
+        get = rules.get
+        for name, setter in SETTERS:
+            setter(self, get(name, MISSING))
+        SETTERS_RULES(self, rules)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('FieldSpec is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('FieldSpec is immutable')
+
+    def __reduce__(self):
+        return (FieldSpec, (self.rules,))
+
+    def __contains__(self, name):
+        return name in self.rules
+
+    def get(self, name, default=None):
+        return self.rules.get(name, default)
+
+    def __repr__(self):
+        return 'FieldSpec(%r)' % (self.rules,)
+
+
+# Slot setters, which bypass FieldSpec.__setattr__
+SETTERS = tuple((name, getattr(FieldSpec, name).__set__) for name in ATTRIBUTES)
+SETTERS_RULES = FieldSpec.rules.__set__
+
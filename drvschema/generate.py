@@ -0,0 +1,248 @@
+# -*- coding: utf-8 -*-
+
+'''
+drvschema.generate
+
+Ahead-of-time generation of static artifacts from a DrvSchema.
+
+The Generator converts every type once and writes a plain Python module of
+literal kwargs dictionaries and a Vuelidate .js module, so that production code
+can import precomputed literals instead of running the converters at startup.
+
+    from myapp.schema_kwargs import DJANGO_MODEL_KWARGS
+
+    class User(models.Model):
+        first_name = models.CharField(**DJANGO_MODEL_KWARGS['User']['first_name'])
+
+Files are only rewritten when the content hash of the output changes.  The
+Watcher polls a schemata file and, when it changes, re-renders only the types
+that differ (see drvschema.schemadiff) before rewriting the outputs.
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+import hashlib
+import os
+import sys
+import time
+from drvschema import vuelidate
+from drvschema.schemadiff import diff
+
+
+# Python module constant name and converter family for each generated kwargs dictionary
+FAMILIES = (
+    ('DJANGO_MODEL_KWARGS', 'DjangoModel'),
+    ('DRF_SERIALIZER_KWARGS', 'DRFSerializer'),
+)
+
+LITERAL_TYPES = (str, int, float, bool, type(None))
+
+
+def literal(value):
+    """
+    Return the Python source for a literal value, raising an Exception if the
+    value cannot be written as a literal (e.g. a callable default)
+    """
+    if isinstance(value, LITERAL_TYPES):
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        items = [literal(v) for v in value]
+        if isinstance(value, tuple):
+            return '(%s)' % ''.join('%s, ' % item for item in items)
+        return '[%s]' % ', '.join(items)
+    if isinstance(value, dict) or hasattr(value, 'items'):
+        return '{%s}' % ', '.join('%s: %s' % (literal(k), literal(v)) for k, v in value.items())
+
+    raise Exception('Value %r cannot be written as a Python literal' % (value,))
+
+
+def contentHash(content):
+    """
+    sha256 hex digest of the content string
+    """
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+
+def writeIfChanged(path, content, comment='#'):
+    """
+    Write content to path with a hash header line, unless the file already has that hash.
+    Returns True if the file was written.
+    """
+    header = '%s sha256: %s\n' % (comment, contentHash(content))
+    if os.path.exists(path):
+        with open(path, 'r') as f:
+            if f.readline() == header:
+                return False
+
+    tmppath = '%s.tmp' % path
+    with open(tmppath, 'w') as f:
+        f.write(header)
+        f.write(content)
+    os.replace(tmppath, path)
+
+    return True
+
+
+class Generator:
+    """
+    Renders the generated Python and JavaScript sources for a DrvSchema.
+
+    Sources are assembled from per-type chunks that are kept on the generator,
+    so a type's chunks are only rendered once.
+    """
+    def __init__(self, appschema):
+        self.appschema = appschema
+        # Rendered chunks keyed by type name
+        self.chunks = {}
+
+    def renderType(self, typename):
+        """
+        Render the Python chunk for each family and the JavaScript chunk for one type
+        """
+        python = {}
+        for constant, family in FAMILIES:
+            lines = ['    %s: {\n' % literal(typename)]
+            for field, kwargs in self.appschema.to_many(family, typename, copy=True).items():
+                lines.append('        %s: %s,\n' % (literal(field), literal(kwargs)))
+            lines.append('    },\n')
+            python[constant] = ''.join(lines)
+
+        jsimports = set()
+        js = 'export const %s = %s\n' % (typename, vuelidate.getValidations(self.appschema.index, typename, jsimports))
+
+        return {'python': python, 'js': js, 'jsimports': jsimports}
+
+    def getChunks(self, typename):
+        """
+        Return the rendered chunks for a type, rendering them if needed
+        """
+        if typename not in self.chunks:
+            self.chunks[typename] = self.renderType(typename)
+        return self.chunks[typename]
+
+    def pythonSource(self, constants=None):
+        """
+        Source of the Python module of literal kwargs constants.  constants limits
+        the module to some of the FAMILIES constant names.
+        """
+        parts = [
+            '# -*- coding: utf-8 -*-\n',
+            '# Generated by drvschema.  Do not edit.\n',
+        ]
+        for constant, family in FAMILIES:
+            if constants is not None and constant not in constants:
+                continue
+            parts.append('\n%s = {\n' % constant)
+            for typename in self.appschema.schemata:
+                parts.append(self.getChunks(typename)['python'][constant])
+            parts.append('}\n')
+
+        return ''.join(parts)
+
+    def jsSource(self):
+        """
+        Source of the Vuelidate validations JavaScript module, the same as
+        drvschema.vuelidate.writeModule writes
+        """
+        imports = set()
+        chunks = []
+        for typename in self.appschema.schemata:
+            imports.update(self.getChunks(typename)['jsimports'])
+            chunks.append(self.getChunks(typename)['js'])
+
+        parts = ['// Generated by drvschema.  Do not edit.\n']
+        if imports:
+            parts.append(vuelidate.importLine(imports))
+        parts.append('\n')
+
+        return ''.join(parts + chunks)
+
+    def update(self, appschema, schemadiff=None):
+        """
+        Switch to a new DrvSchema, dropping the rendered chunks of the types that
+        differ from the current one so that only those are re-rendered.
+        Returns the SchemaDiff.
+        """
+        if schemadiff is None:
+            schemadiff = diff(self.appschema, appschema)
+        for typename in schemadiff.types:
+            self.chunks.pop(typename, None)
+        self.appschema = appschema
+
+        return schemadiff
+
+    def write(self, pythonpath=None, jspath=None):
+        """
+        Write the Python and / or JavaScript outputs.
+        Returns the list of paths that were actually rewritten.
+        """
+        written = []
+        if pythonpath and writeIfChanged(pythonpath, self.pythonSource()):
+            written.append(pythonpath)
+        if jspath and writeIfChanged(jspath, self.jsSource(), comment='//'):
+            written.append(jspath)
+
+        return written
+
+
+class Watcher:
+    """
+    Polls a schemata file and regenerates the outputs of the types that changed
+    """
+    def __init__(self, schemapath, pythonpath=None, jspath=None, cache_dir=None):
+        from drvschema import DrvSchema
+
+        self.loader = lambda: DrvSchema.from_file(schemapath, cache_dir=cache_dir)
+        self.schemapath = schemapath
+        self.pythonpath = pythonpath
+        self.jspath = jspath
+        self.signature = self.getSignature()
+        self.generator = Generator(self.loader())
+
+    def getSignature(self):
+        stat = os.stat(self.schemapath)
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def write(self):
+        return self.generator.write(self.pythonpath, self.jspath)
+
+    def poll(self):
+        """
+        Regenerate if the schemata file changed since the last poll.
+        Returns the SchemaDiff, or None if the file did not change.
+        """
+        signature = self.getSignature()
+        if signature == self.signature:
+            return None
+
+        appschema = self.loader()
+        self.signature = signature
+        schemadiff = self.generator.update(appschema)
+        self.write()
+        return schemadiff
+
+
+def watch(schemapath, pythonpath=None, jspath=None, interval=1.0, cache_dir=None, output=sys.stdout):
+    """
+    Generate the outputs and then regenerate the changed types whenever the
+    schemata file changes, until interrupted.  Errors while loading a changed
+    file (e.g. a half-saved file) are reported and the next change is awaited.
+    """
+    watcher = Watcher(schemapath, pythonpath, jspath, cache_dir=cache_dir)
+    watcher.write()
+    output.write('Watching %s\n' % schemapath)
+    while True:
+        time.sleep(interval)
+        try:
+            schemadiff = watcher.poll()
+        except Exception as e:
+            watcher.signature = watcher.getSignature()
+            output.write('Error loading %s: %s\n' % (schemapath, str(e)))
+            continue
+        if schemadiff:
+            output.write('Regenerated %s\n' % ', '.join(sorted(schemadiff.types)))
+        output.flush()
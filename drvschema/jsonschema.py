@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+
+'''
+drvschema.jsonschema
+
+JSON Schema and OpenAPI components export.
+
+The JSONSchema converter reads the same FieldSpecs as the Django and DRF
+converters and returns a JSON Schema (2020-12, as used by OpenAPI 3.1) for a
+type or for a single field.  Like every converter, its results are cached by
+DrvSchema.to.
+
+    >>> APPSCHEMA.to('JSONSchema', 'User')
+    {'type': 'object', 'properties': {'first_name': {'type': 'string', 'maxLength': 200, ...}}, ...}
+
+getComponents returns the OpenAPI components object for the whole app and
+writeComponents streams it to a file one type at a time.
+
+    python -m drvschema openapi --schema schema.yaml --output components.json
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+import json
+from drvschema import converter
+from drvschema.fieldspec import MISSING
+
+
+# JSON Schema for each Cerberus type
+JSON_TYPES = {
+    'string': {'type': 'string'},
+    'boolean': {'type': 'boolean'},
+    'integer': {'type': 'integer'},
+    'float': {'type': 'number'},
+    'number': {'type': 'number'},
+    'datetime': {'type': 'string', 'format': 'date-time'},
+    'date': {'type': 'string', 'format': 'date'},
+    'binary': {'type': 'string', 'format': 'binary'},
+    'dict': {'type': 'object'},
+    'list': {'type': 'array'},
+    'set': {'type': 'array', 'uniqueItems': True},
+}
+
+JSON_VALUE_TYPES = (str, int, float, bool, type(None), list, dict)
+
+
+def getObjectSchema(schemata, keystr):
+    """
+    Return the JSON Schema object for the fields of a type or nested dict field key string
+    """
+    properties = {}
+    required = []
+    for field, spec in converter.getFieldSpecs(schemata, keystr):
+        properties[field] = getFieldSchema(schemata, '%s.%s' % (keystr, field), spec)
+        if spec.required:
+            required.append(field)
+
+    result = {'type': 'object', 'properties': properties}
+    if required:
+        result['required'] = required
+    result['additionalProperties'] = False
+
+    return result
+
+
+def getFieldSchema(schemata, keystr, spec=None):
+    """
+    Return the JSON Schema of a field key string
+    """
+    if spec is None:
+        spec = converter.getFieldSpec(schemata, keystr)
+
+    result = {}
+    if isinstance(spec.type, str) and spec.type in JSON_TYPES:
+        result.update(JSON_TYPES[spec.type])
+    if spec.nullable and 'type' in result:
+        result['type'] = [result['type'], 'null']
+    if spec.help is not MISSING:
+        result['description'] = spec.help
+    if spec.default is not MISSING and isinstance(spec.default, JSON_VALUE_TYPES):
+        result['default'] = spec.default
+    if spec.readonly:
+        result['readOnly'] = True
+
+    array = spec.type in ('list', 'set')
+    if spec.minlength is not MISSING:
+        result['minItems' if array else 'minLength'] = spec.minlength
+    elif spec.empty is False and spec.type == 'string':
+        result['minLength'] = 1
+    if spec.maxlength is not MISSING:
+        result['maxItems' if array else 'maxLength'] = spec.maxlength
+    if converter.isNumber(spec.min):
+        result['minimum'] = spec.min
+    if converter.isNumber(spec.max):
+        result['maximum'] = spec.max
+    if spec.regex is not MISSING:
+        # Cerberus regexes must match the whole value
+        result['pattern'] = '^(?:%s)$' % spec.regex
+    if spec.allowed is not MISSING:
+        if array:
+            result['items'] = {'enum': list(spec.allowed)}
+        else:
+            result['enum'] = list(spec.allowed)
+            # A nullable field also accepts null, which the type allows
+            if spec.nullable and None not in result['enum']:
+                result['enum'].append(None)
+
+    if converter.getNestedFields(spec.rules) is not None:
+        nested = getObjectSchema(schemata, keystr)
+        del nested['type']
+        result.update(nested)
+    elif converter.getItemsSchema(spec.rules) is not None:
+        items = getFieldSchema(schemata, '%s.%s' % (keystr, converter.ITEMS_KEY))
+        if array:
+            if spec.allowed is not MISSING:
+                # The allowed values of the list and of its items both apply
+                allowed = items.get('enum', spec.allowed)
+                items['enum'] = [value for value in spec.allowed if value in allowed]
+            result['items'] = items
+        else:
+            result['additionalProperties'] = items
+
+    return result
+
+
+def JSONSchema(schemata, keystr):
+    """
+    Convert a type, or a field, to a JSON Schema
+    """
+    if '.' not in keystr:
+        return getObjectSchema(schemata, keystr)
+    return getFieldSchema(schemata, keystr)
+
+
+def getComponents(appschema):
+    """
+    Return the OpenAPI components object with a schema for every type
+    """
+    return {
+        'components': {
+            'schemas': {typename: appschema.to('JSONSchema', typename, copy=True) for typename in appschema.schemata},
+        },
+    }
+
+
+def writeComponents(appschema, stream, indent=None):
+    """
+    Write the OpenAPI components object as JSON to a stream, one type at a time
+    """
+    stream.write('{"components": {"schemas": {')
+    separator = ''
+    for typename in appschema.schemata:
+        stream.write('%s%s: ' % (separator, json.dumps(typename)))
+        json.dump(appschema.to('JSONSchema', typename), stream, indent=indent, default=dict)
+        separator = ', '
+    stream.write('}}}\n')
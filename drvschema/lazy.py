@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+'''
+drvschema.lazy
+
+Lazily loaded schemata for large, sharded multi-app schemata.
+
+A LazySchemata is a read-only mapping of type name to type schema that fetches
+each type from a loader the first time it is used and keeps at most maxsize
+types, evicting the least recently used one.  The loader is either a callable
+that returns the schema of a type (raising KeyError for unknown types), or a
+directory of per-type JSON or YAML files named after the types (User.json,
+Group.yaml, ...).
+
+    APPSCHEMA = DrvSchema(loader='/etc/myapp/schema', max_types=64)
+    APPSCHEMA = DrvSchema(loader=fetchTypeSchema, typenames=['User', 'Group'])
+
+Types that are never used are never read or parsed.  When a type is loaded,
+DrvSchema indexes it like buildSchemaIndex does, and its LazySchemaIndex loads the
+type of a missing key, so converters can index their schemata argument as usual.
+When a type is evicted, DrvSchema drops its index entries and cached results as well.
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+from collections import OrderedDict
+from collections.abc import Mapping
+import os
+from drvschema import converter
+
+
+SCHEMA_FILE_EXTENSIONS = ('.json', '.yaml', '.yml')
+
+
+class DirectoryLoader:
+    """
+    Loads type schemata from a directory of per-type JSON or YAML files
+    """
+    def __init__(self, path):
+        self.path = path
+
+    def getPath(self, typename):
+        for extension in SCHEMA_FILE_EXTENSIONS:
+            path = os.path.join(self.path, '%s%s' % (typename, extension))
+            if os.path.exists(path):
+                return path
+        return None
+
+    def typenames(self):
+        """
+        Return the sorted type names of the schema files in the directory
+        """
+        return sorted(
+            os.path.splitext(filename)[0] for filename in os.listdir(self.path)
+            if filename.endswith(SCHEMA_FILE_EXTENSIONS)
+        )
+
+    def __call__(self, typename):
+        from drvschema.schemafile import parseSchemaFile
+
+        path = self.getPath(typename)
+        if path is None:
+            raise KeyError(typename)
+        with open(path, 'rb') as f:
+            return parseSchemaFile(path, f.read())
+
+
+class LazySchemata(Mapping):
+    """
+    Mapping of type name to type schema loaded on first access and kept in a
+    bounded LRU cache.  Functions in added are called with the name and schema of
+    each loaded type, and functions in evicted with each evicted type name.
+    """
+    def __init__(self, loader, maxsize=128, typenames=None, validate=False):
+        if isinstance(loader, str):
+            loader = DirectoryLoader(loader)
+        if typenames is None and hasattr(loader, 'typenames'):
+            typenames = loader.typenames()
+        self.loader = loader
+        self.maxsize = maxsize
+        self.typenames = list(typenames) if typenames is not None else None
+        self.names = frozenset(self.typenames) if typenames is not None else None
+        self.validate = validate
+        self.loaded = OrderedDict()
+        self.added = []
+        self.evicted = []
+
+    def __getitem__(self, typename):
+        loaded = self.loaded
+        try:
+            typeschema = loaded[typename]
+        except KeyError:
+            if self.names is not None and typename not in self.names:
+                raise
+            typeschema = self.loader(typename)
+            if self.validate:
+                converter.validateSchemata({typename: typeschema})
+            loaded[typename] = typeschema
+            while len(loaded) > self.maxsize:
+                evictedname, evictedschema = loaded.popitem(last=False)
+                for func in self.evicted:
+                    func(evictedname)
+            for func in self.added:
+                func(typename, typeschema)
+        else:
+            loaded.move_to_end(typename)
+
+        return typeschema
+
+    def touch(self, typename):
+        """
+        Mark a type as recently used, loading it if needed.  Unknown types are ignored.
+        """
+        if typename in self.loaded:
+            self.loaded.move_to_end(typename)
+            return
+        try:
+            self[typename]
+        except KeyError:
+            pass
+
+    def __contains__(self, typename):
+        if typename in self.loaded:
+            return True
+        if self.names is not None:
+            return typename in self.names
+        try:
+            self[typename]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        if self.typenames is None:
+            raise Exception('The type names of the loader are not known; pass typenames')
+        return iter(self.typenames)
+
+    def __len__(self):
+        if self.typenames is None:
+            raise Exception('The type names of the loader are not known; pass typenames')
+        return len(self.typenames)
+
+    def clear(self):
+        """
+        Drop every loaded type, without calling the evicted functions
+        """
+        self.loaded.clear()
+
+
+class LazySchemaIndex(converter.SchemaIndex):
+    """
+    SchemaIndex of a LazySchemata that loads the type of a missing key, so that
+    index[keystr] works for types that are not loaded yet
+    """
+    def __missing__(self, keystr):
+        try:
+            self.schemata[keystr.split('.', 1)[0]]
+        except KeyError:
+            pass
+        if dict.__contains__(self, keystr):
+            return dict.__getitem__(self, keystr)
+        raise KeyError(keystr)
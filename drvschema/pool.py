@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+'''
+drvschema.pool
+
+Thread-safe pools of prebuilt Cerberus validators.
+
+Constructing a cerberus.Validator normalizes and checks the schema, which is
+most of the cost of validating a small document.  A ValidatorPool compiles the
+schema of a type once and hands out validators that share it, creating a new one
+only when every pooled validator is in use.  Validators are reset when they are
+returned so they do not keep the last document alive.
+
+    with APPSCHEMA.validator('User') as validator:
+        if not validator.validate(document):
+            return Response(validator.errors, status=400)
+
+drvschema annotations that are not Cerberus rules (help, unique, index, ...) are
+removed from the schema.  Requires Cerberus.
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+from contextlib import contextmanager
+import queue
+from drvschema import converter
+from drvschema.validation import IGNORED_RULES
+
+
+# Rules holding the rules of the keys or values of a dict field
+SUBRULES = ('keysrules', 'keyschema') + converter.VALUES_RULES
+
+
+def getCerberusRules(schema):
+    """
+    Return a copy of a field schema without the rules Cerberus does not know,
+    including those of nested fields and items
+    """
+    rules = {rule: value for rule, value in schema.items() if rule not in IGNORED_RULES}
+    fields = converter.getNestedFields(schema)
+    if fields is not None:
+        rules['schema'] = getCerberusSchema(fields)
+    elif schema.get('type') == 'list' and isinstance(schema.get('schema'), dict):
+        rules['schema'] = getCerberusRules(schema['schema'])
+    for rule in SUBRULES:
+        if isinstance(schema.get(rule), dict):
+            rules[rule] = getCerberusRules(schema[rule])
+
+    return rules
+
+
+def getCerberusSchema(typeschema):
+    """
+    Return a copy of the schema of a type that Cerberus can use
+    """
+    return {field: getCerberusRules(schema) for field, schema in typeschema.items()}
+
+
+class ValidatorPool:
+    """
+    LIFO pool of cerberus.Validators sharing one compiled schema.  At most size
+    idle validators are kept (no limit if size is 0).
+    """
+    def __init__(self, typeschema, allow_unknown=False, size=0):
+        import cerberus
+
+        self.allow_unknown = allow_unknown
+        self.validators = queue.LifoQueue(maxsize=size)
+        validator = cerberus.Validator(getCerberusSchema(typeschema), allow_unknown=allow_unknown)
+        # The compiled cerberus.schema.DefinitionSchema, which validators take as is
+        self.schema = validator.schema
+        self.validators.put(validator)
+        self.validatorclass = cerberus.Validator
+
+    def acquire(self):
+        """
+        Return an idle validator, or a new one if all of them are in use
+        """
+        try:
+            return self.validators.get_nowait()
+        except queue.Empty:
+            return self.validatorclass(self.schema, allow_unknown=self.allow_unknown)
+
+    def release(self, validator):
+        """
+        Reset a validator and return it to the pool
+        """
+        validator.document = None
+        validator.recent_error = None
+        validator._errors.clear()
+        validator.document_error_tree = None
+        validator.schema_error_tree = None
+        validator.allow_unknown = self.allow_unknown
+        try:
+            self.validators.put_nowait(validator)
+        except queue.Full:
+            pass
+
+    @contextmanager
+    def lease(self):
+        """
+        Context manager that acquires a validator and releases it on exit
+        """
+        validator = self.acquire()
+        try:
+            yield validator
+        finally:
+            self.release(validator)
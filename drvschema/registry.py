@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+'''
+drvschema.registry
+
+Registry of converters by name.
+
+Converters are registered either as functions or as 'module:attribute'
+references that are only imported the first time the converter is used.
+Third-party packages can add converters through the drvschema.converters
+entry point group, e.g. in their setup.py
+
+    entry_points={
+        'drvschema.converters': [
+            'WTFormsStringFieldKwargs = myconverters:WTFormsStringFieldKwargs',
+        ],
+    }
+
+Entry points are only scanned when a name that is not registered is looked up.
+
+    from drvschema import registry
+
+    @registry.register('MyConverter')
+    def MyConverter(schemata, keystr):
+        ...
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+from collections.abc import Mapping
+import importlib
+
+
+ENTRY_POINT_GROUP = 'drvschema.converters'
+
+
+def resolve(reference):
+    """
+    Import and return the object named by a 'module:attribute' reference
+    """
+    modulename, attrname = reference.split(':', 1)
+    return getattr(importlib.import_module(modulename), attrname)
+
+
+class Registry(Mapping):
+    """
+    Mapping of converter name to converter function that loads converters on first use
+    """
+    def __init__(self, group=ENTRY_POINT_GROUP):
+        self.group = group
+        self.entries = {}
+        self.discovered = False
+
+    def register(self, name, func=None):
+        """
+        Register a converter function, or a 'module:attribute' reference to one, by name.
+        Can also be used as a decorator: @registry.register('Name')
+        """
+        if func is None:
+            def decorator(f):
+                self.entries[name] = f
+                return f
+            return decorator
+
+        self.entries[name] = func
+        return func
+
+    def discover(self):
+        """
+        Register the converters of the entry point group that are not already registered
+        """
+        self.discovered = True
+        from importlib import metadata
+
+        entrypoints = metadata.entry_points()
+        if hasattr(entrypoints, 'select'):
+            entrypoints = entrypoints.select(group=self.group)
+        else:
+            entrypoints = entrypoints.get(self.group, [])
+        for entrypoint in entrypoints:
+            self.entries.setdefault(entrypoint.name, entrypoint.value)
+
+    def __contains__(self, name):
+        if name not in self.entries and not self.discovered:
+            self.discover()
+        return name in self.entries
+
+    def __getitem__(self, name):
+        if name not in self:
+            raise KeyError(name)
+
+        func = self.entries[name]
+        if isinstance(func, str):
+            func = self.entries[name] = resolve(func)
+        return func
+
+    def __iter__(self):
+        if not self.discovered:
+            self.discover()
+        return iter(list(self.entries))
+
+    def __len__(self):
+        if not self.discovered:
+            self.discover()
+        return len(self.entries)
+
+
+converters = Registry()
+
+for name in (
+    'DjangoModelCharFieldKwargs',
+    'DjangoModelBooleanFieldKwargs',
+    'DjangoModelIntegerFieldKwargs',
+    'DjangoModelFloatFieldKwargs',
+    'DjangoModelDateTimeFieldKwargs',
+    'DjangoModelDateFieldKwargs',
+    'DjangoModelForeignKeyFieldKwargs',
+    'DjangoModelJSONFieldKwargs',
+    'DjangoModelMetaKwargs',
+    'DRFSerializerCharFieldKwargs',
+    'DRFSerializerBooleanFieldKwargs',
+    'DRFSerializerIntegerFieldKwargs',
+    'DRFSerializerFloatFieldKwargs',
+    'DRFSerializerDateTimeFieldKwargs',
+    'DRFSerializerDateFieldKwargs',
+    'DRFSerializerJSONFieldKwargs',
+    'VuelidateValidations',
+):
+    converters.register(name, 'drvschema.converter:%s' % name)
+
+converters.register('JSONSchema', 'drvschema.jsonschema:JSONSchema')
+
+
+def register(name, func=None):
+    """
+    Register a converter with the default registry
+    """
+    return converters.register(name, func)
+
+
+def get(name):
+    """
+    Return a converter from the default registry
+    """
+    if name not in converters:
+        raise Exception('Converter %s is not registered' % name)
+    return converters[name]
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+'''
+drvschema.schemadiff
+
+Differences between two schemata.
+
+    d = drvschema.diff(OLDSCHEMA, NEWSCHEMA)
+    d.added     # ['Group', 'User.email']
+    d.removed   # ['User.nickname']
+    d.changed   # ['User.first_name']
+    d.types     # {'Group', 'User'}
+
+Paths are dotted type or field paths.  A type that was added or removed is
+reported as a single type path rather than one path per field.
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+
+
+class SchemaDiff:
+    """
+    Sorted lists of added, removed and changed paths and the set of affected type names
+    """
+    def __init__(self, added, removed, changed):
+        self.added = sorted(added)
+        self.removed = sorted(removed)
+        self.changed = sorted(changed)
+        self.types = {path.split('.', 1)[0] for path in self.added + self.removed + self.changed}
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+    def __repr__(self):
+        return 'SchemaDiff(added=%r, removed=%r, changed=%r)' % (self.added, self.removed, self.changed)
+
+
+def getSchemata(schema):
+    """
+    Return the schemata dictionary of a DrvSchema, or the argument if it is already a dictionary
+    """
+    return getattr(schema, 'schemata', schema)
+
+
+def diff(old, new):
+    """
+    Compare two schemata (dictionaries or DrvSchemas) and return a SchemaDiff
+    """
+    old = getSchemata(old)
+    new = getSchemata(new)
+    added = []
+    removed = []
+    changed = []
+
+    for typename, oldtype in old.items():
+        if typename not in new:
+            removed.append(typename)
+            continue
+        newtype = new[typename]
+        if oldtype == newtype:
+            continue
+        for field, oldschema in oldtype.items():
+            if field not in newtype:
+                removed.append('%s.%s' % (typename, field))
+            elif newtype[field] != oldschema:
+                changed.append('%s.%s' % (typename, field))
+        added.extend('%s.%s' % (typename, field) for field in newtype if field not in oldtype)
+        if list(oldtype) != list(newtype) and not any(path.startswith('%s.' % typename) for path in added + removed + changed):
+            # Only the field order changed, which still changes the generated output
+            changed.append(typename)
+
+    added.extend(typename for typename in new if typename not in old)
+
+    return SchemaDiff(added, removed, changed)
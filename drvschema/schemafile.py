@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+'''
+drvschema.schemafile
+
+Loading of schemata from JSON or YAML files with an on-disk compiled cache.
+
+Parsing a large schemata file in every process is slow, so the parsed, validated
+schemata is pickled into a cache directory.  Only the plain schemata dictionary is
+cached; its index is rebuilt on load, which is cheap, so changes to the SchemaIndex
+class never make a cache unusable.  The cache file name is derived from the sha256
+of the schema file contents, the drvschema version and CACHE_FORMAT, so an edited
+file or an upgraded drvschema never reads a stale cache.  Unreadable or corrupt
+cache files are ignored and rewritten.
+
+    APPSCHEMA = DrvSchema.from_file('schema.yaml', cache_dir='/var/cache/drvschema')
+
+YAML files require PyYAML.
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from drvschema import converter
+
+
+# Version of the contents of cache files; change it when they change
+CACHE_FORMAT = '2'
+
+
+def parseSchemaFile(path, data):
+    """
+    Parse the bytes of a JSON or YAML schemata file, choosing the format from the extension
+    """
+    if path.endswith(('.yaml', '.yml')):
+        import yaml
+        return yaml.safe_load(data)
+    if path.endswith('.json'):
+        return json.loads(data.decode('utf-8'))
+
+    raise Exception('Schema file %s must be a .json, .yaml or .yml file' % path)
+
+
+def getCachePath(cache_dir, data):
+    """
+    Path of the cache file for the schema file contents, drvschema version and cache format
+    """
+    from drvschema import __version__
+
+    digest = hashlib.sha256(data)
+    digest.update(('%s/%s' % (__version__, CACHE_FORMAT)).encode('utf-8'))
+    return os.path.join(cache_dir, 'drvschema-%s.pickle' % digest.hexdigest())
+
+
+def readCache(cachepath):
+    """
+    Return the schemata stored in a cache file, or None if it is missing or unusable
+    """
+    try:
+        with open(cachepath, 'rb') as f:
+            schemata = pickle.load(f)
+    except Exception:
+        return None
+
+    if not isinstance(schemata, dict):
+        return None
+    return schemata
+
+
+def writeCache(cachepath, schemata):
+    """
+    Atomically write the schemata to a cache file.  Failures are ignored.
+    """
+    cache_dir = os.path.dirname(cachepath)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmppath = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(schemata, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmppath, cachepath)
+        except Exception:
+            os.unlink(tmppath)
+            raise
+    except Exception:
+        pass
+
+
+def loadSchemaFile(path, cache_dir=None, validate=True):
+    """
+    Return the (schemata, index) for a schema file, from the cache when possible
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    cachepath = None
+    schemata = None
+    if cache_dir is not None:
+        cachepath = getCachePath(cache_dir, data)
+        schemata = readCache(cachepath)
+
+    if schemata is None:
+        schemata = parseSchemaFile(path, data)
+        if validate:
+            converter.validateSchemata(schemata)
+        if cachepath is not None:
+            writeCache(cachepath, schemata)
+
+    return schemata, converter.buildSchemaIndex(schemata)
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+
+'''
+drvschema.stream
+
+Streaming validation of NDJSON and CSV files with bounded memory.
+
+Records are read lazily one at a time and validated with the type's compiled
+validator (see drvschema.validation), so memory use does not depend on the size
+of the input.
+
+    from drvschema import stream
+
+    stats = stream.StreamStats()
+    with open('users.ndjson') as f, open('rejects.ndjson', 'w') as rejects:
+        for record, errors in stream.validate(f, 'User', APPSCHEMA, rejects=rejects, stats=stats):
+            if not errors:
+                save(record)
+    print('%d records, %.0f records/s' % (stats.records, stats.recordsPerSecond))
+
+CSV cells are strings, so before validation they are converted to the Cerberus
+type of their field (boolean, integer, float, number, datetime or date); empty
+cells are treated as missing values.  In NDJSON only datetime and date strings
+(ISO 8601) are converted.  A value that cannot be converted is left as it is and
+fails the type rule, e.g. 'must be of boolean type'.  Fields that accept strings
+are never converted.
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+import csv
+from datetime import date, datetime
+import json
+import time
+from drvschema import converter
+
+
+TRUE_STRINGS = frozenset(('true', 't', 'yes', 'y', '1'))
+FALSE_STRINGS = frozenset(('false', 'f', 'no', 'n', '0'))
+
+
+def parseBoolean(value):
+    """
+    Parse true/false, t/f, yes/no, y/n or 1/0, ignoring case
+    """
+    lowered = value.strip().lower()
+    if lowered in TRUE_STRINGS:
+        return True
+    if lowered in FALSE_STRINGS:
+        return False
+    raise ValueError('Invalid boolean %r' % value)
+
+
+def parseNumber(value):
+    """
+    Parse an integer, or else a float
+    """
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def parseDatetime(value):
+    """
+    Parse an ISO 8601 datetime, including a Z (UTC) suffix
+    """
+    if value.endswith(('Z', 'z')):
+        value = '%s+00:00' % value[:-1]
+    return datetime.fromisoformat(value)
+
+
+def parseDate(value):
+    """
+    Parse an ISO 8601 date
+    """
+    return date.fromisoformat(value)
+
+
+# Functions converting a string to each Cerberus type; they raise ValueError
+# for strings that are not valid for the type
+PARSERS = {
+    'boolean': parseBoolean,
+    'integer': int,
+    'float': float,
+    'number': parseNumber,
+    'datetime': parseDatetime,
+    'date': parseDate,
+}
+
+# Types converted from strings in each format
+COERCED_TYPES = {
+    'ndjson': ('datetime', 'date'),
+    'csv': tuple(PARSERS),
+}
+
+
+def compileCoercer(typeschema, types):
+    """
+    Return a function that takes a record and returns it with the string values of
+    fields of one of types converted to the Cerberus type of the field.  The record
+    is copied if a value is converted; values that cannot be converted are left as is.
+    """
+    parsers = {}
+    for field, schema in typeschema.items():
+        fieldtypes = schema.get('type')
+        if isinstance(fieldtypes, str):
+            fieldtypes = [fieldtypes]
+        if not fieldtypes or 'string' in fieldtypes:
+            continue
+        fieldparsers = [PARSERS[fieldtype] for fieldtype in fieldtypes if fieldtype in types]
+        if fieldparsers:
+            parsers[field] = fieldparsers
+
+    def coerce(record):
+        coerced = record
+        for field, fieldparsers in parsers.items():
+            value = record.get(field)
+            if not isinstance(value, str):
+                continue
+            for parser in fieldparsers:
+                try:
+                    parsed = parser(value)
+                except ValueError:
+                    continue
+                if coerced is record:
+                    coerced = dict(record)
+                coerced[field] = parsed
+                break
+        return coerced
+
+    return coerce
+
+
+class StreamStats:
+    """
+    Record and reject counts and throughput of a streaming validation
+    """
+    def __init__(self):
+        self.records = 0
+        self.rejected = 0
+        self.started = None
+        self.finished = None
+
+    @property
+    def elapsed(self):
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.perf_counter()) - self.started
+
+    @property
+    def recordsPerSecond(self):
+        elapsed = self.elapsed
+        return self.records / elapsed if elapsed > 0 else 0.0
+
+
+def readNdjson(fileobj):
+    """
+    Yield one record per non-blank line of an NDJSON file
+    """
+    for line in fileobj:
+        if line.strip():
+            yield json.loads(line)
+
+
+def readCsv(fileobj):
+    """
+    Yield one record per CSV row, leaving out empty cells
+    """
+    for row in csv.DictReader(fileobj):
+        yield {field: value for field, value in row.items() if value != ''}
+
+
+READERS = {
+    'ndjson': readNdjson,
+    'csv': readCsv,
+}
+
+
+def validate(fileobj, typename, appschema, format='ndjson', rejects=None, stats=None, allow_unknown=False):
+    """
+    Lazily validate the records of fileobj against a type of the DrvSchema and
+    yield (record, errors) pairs, where record has defaults filled in and errors
+    is a Cerberus style dictionary (empty for valid records).
+
+    If rejects is a writable file object, each invalid record is also written to it
+    as an NDJSON line of the form {"record": ..., "errors": ...}.  If stats is a
+    StreamStats it is updated as records are read.
+    """
+    if format not in READERS:
+        raise Exception('Unknown stream format %s' % format)
+
+    check = appschema.compile_validator(typename, allow_unknown=allow_unknown)
+    coerce = compileCoercer(converter.getSchemaFromKeys(appschema.index, typename), COERCED_TYPES[format])
+    if stats is None:
+        stats = StreamStats()
+    stats.started = time.perf_counter()
+    stats.finished = None
+
+    try:
+        for record in READERS[format](fileobj):
+            document, errors = check(coerce(record))
+            stats.records += 1
+            if errors:
+                stats.rejected += 1
+                if rejects is not None:
+                    rejects.write('%s\n' % json.dumps({'record': record, 'errors': errors}, default=str))
+            yield document, errors
+    finally:
+        stats.finished = time.perf_counter()
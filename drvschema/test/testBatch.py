@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+'''
+testBatch
+
+Test for asyncio batch validation
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+import unittest
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from drvschema import DrvSchema
+
+
+SCHEMATA = {
+    'User': {
+        'first_name': {
+            'type': 'string',
+            'required': True,
+            'maxlength': 10,
+        },
+        'is_enabled': {
+            'type': 'boolean',
+            'default': False,
+        },
+    }
+}
+
+RECORDS = [{'first_name': 'x' * (i % 12)} for i in range(100)]
+
+
+async def collect(appschema, records, **kwargs):
+    chunks = []
+    async for start, results in appschema.avalidate_many('User', records, **kwargs):
+        chunks.append((start, results))
+    return chunks
+
+
+async def generateRecords():
+    for record in RECORDS:
+        await asyncio.sleep(0)
+        yield record
+
+
+class TestBatch(unittest.TestCase):
+
+    def check(self, chunks, chunk_size):
+        """
+        Check that the chunks cover RECORDS in order with the expected errors
+        """
+        results = [result for start, chunk in sorted(chunks, key=lambda item: item[0]) for result in chunk]
+        self.assertTrue(len(results) == len(RECORDS))
+        self.assertTrue(all(len(chunk) <= chunk_size for start, chunk in chunks))
+        for i, (document, errors) in enumerate(results):
+            self.assertTrue(document['is_enabled'] is False)
+            self.assertTrue(bool(errors) == (i % 12 > 10))
+
+    def testThreads(self):
+        """
+        Ensure records, including async iterables, are validated in chunks on the default executor
+        """
+        appschema = DrvSchema(SCHEMATA)
+        chunks = asyncio.run(collect(appschema, RECORDS, chunk_size=7, max_pending=2))
+        self.assertTrue(len(chunks) == 15)
+        self.check(chunks, 7)
+        self.check(asyncio.run(collect(appschema, generateRecords(), chunk_size=10)), 10)
+
+    def testProcesses(self):
+        """
+        Ensure chunks are validated in worker processes
+        """
+        appschema = DrvSchema(SCHEMATA)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            chunks = asyncio.run(collect(appschema, RECORDS, chunk_size=25, executor=executor))
+        self.check(chunks, 25)
+
+
+if __name__ == '__main__':
+    unittest.main()
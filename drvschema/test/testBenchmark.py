@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+'''
+testBenchmark
+
+Test for the benchmark suite and synthetic schemata generator
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+import unittest
+import json
+from drvschema import DrvSchema, registry
+from drvschema.benchmark import FIELD_CONVERTERS, TYPE_CONVERTERS, run, syntheticSchemata
+
+try:
+    import cerberus
+except ImportError:
+    cerberus = None
+
+
+class TestBenchmark(unittest.TestCase):
+
+    def testSyntheticSchemata(self):
+        """
+        Ensure the synthetic schemata has the requested number of fields and validates
+        """
+        schemata = syntheticSchemata(120, fieldspertype=50)
+        self.assertTrue(list(schemata.keys()) == ['Type0', 'Type1', 'Type2'])
+        self.assertTrue(sum(len(fields) for fields in schemata.values()) == 120)
+        DrvSchema(schemata, validate=True)
+
+    def testCoverage(self):
+        """
+        Ensure every converter that ships with drvschema is benchmarked on fields that exist
+        """
+        builtin = {
+            name for name, func in registry.converters.entries.items()
+            if (func if isinstance(func, str) else func.__module__).startswith('drvschema.')
+        }
+        benchmarked = {name for names in FIELD_CONVERTERS.values() for name in names}
+        benchmarked.update(name for name, requirement in TYPE_CONVERTERS)
+        self.assertTrue(builtin <= benchmarked, builtin - benchmarked)
+
+        fieldtypes = {schema['type'] for fields in syntheticSchemata(1000).values() for schema in fields.values()}
+        self.assertTrue(set(FIELD_CONVERTERS) <= fieldtypes)
+
+    def testReport(self):
+        """
+        Ensure the report is JSON serializable and covers every size
+        """
+        report = json.loads(json.dumps(run([10, 100])))
+        self.assertTrue({result['fields'] for result in report['results']} == {10, 100})
+        self.assertTrue(any(result['name'] == 'DrvSchema.to(VuelidateValidations)' for result in report['results']))
+        if cerberus is not None:
+            self.assertTrue(any(result['name'].startswith('DrvSchema.validator(pooled)') for result in report['results']))
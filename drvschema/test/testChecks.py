@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+'''
+testChecks
+
+Test for the schema vs. migration drift check
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+import unittest
+from drvschema import DrvSchema
+from drvschema.checks import compareFields
+
+try:
+    import django
+except ImportError:
+    django = None
+
+
+SCHEMATA = {
+    'Test': {
+        'name': {
+            'type': 'string',
+            'required': True,
+            'maxlength': 100,
+        },
+        'is_enabled': {
+            'type': 'boolean',
+            'default': False,
+        },
+        'count': {
+            'type': 'integer',
+        },
+        'avatar': {
+            'type': 'binary',
+        },
+    }
+}
+
+
+class TestChecks(unittest.TestCase):
+
+    def testCompareFields(self):
+        """
+        Ensure missing fields, changed field classes and changed kwargs are reported
+        """
+        expected = {
+            'name': ('CharField', {'max_length': 100, 'default': None}),
+            'is_enabled': ('BooleanField', {'default': False}),
+            'created': ('DateTimeField', {}),
+        }
+        actual = {
+            'name': ('CharField', {'max_length': 50}),
+            'is_enabled': ('CharField', {'max_length': 5}),
+            'id': ('AutoField', {'primary_key': True}),
+        }
+        self.assertTrue(compareFields(expected, actual) == [
+            ('name', "default is '<absent>' in the migrations, None in the schema, max_length is 50 in the migrations, 100 in the schema"),
+            ('is_enabled', 'it is a CharField in the migrations, a BooleanField in the schema'),
+            ('created', 'the field is not in the migrations'),
+        ])
+        self.assertTrue(compareFields(expected, dict(expected)) == [])
+
+    @unittest.skipUnless(django, 'Django is not installed')
+    def testCheckDrift(self):
+        """
+        Ensure drifted fields of a migration state are reported as check warnings
+        """
+        from django.db import models
+        from django.db.migrations.state import ModelState, ProjectState
+        from drvschema.checks import checkDrift
+
+        appschema = DrvSchema(SCHEMATA)
+        state = ProjectState()
+        state.add_model(ModelState('drv', 'test', [
+            ('id', models.AutoField(primary_key=True)),
+            ('name', models.CharField(max_length=100, default=None)),
+            ('is_enabled', models.BooleanField(default=False)),
+            ('count', models.IntegerField()),
+        ]))
+        self.assertTrue(checkDrift(appschema, 'drv', state) == [])
+
+        state.models[('drv', 'test')].fields['name'] = models.CharField(max_length=50, default=None)
+        messages = checkDrift(appschema, 'drv', state)
+        self.assertTrue(len(messages) == 1)
+        self.assertTrue(messages[0].id == 'drvschema.W001' and messages[0].obj == 'drv.Test.name')
+        self.assertTrue('max_length is 50 in the migrations, 100 in the schema' in messages[0].msg)
+        self.assertTrue(checkDrift(appschema, 'other', state) == [])
+
+    @unittest.skipUnless(django, 'Django is not installed')
+    def testCheckOptionDrift(self):
+        """
+        Ensure drifted Meta constraints and indexes are reported as check warnings
+        """
+        from django.conf import settings
+        if not settings.configured:
+            settings.configure()
+        django.setup()
+        from django.db import models
+        from django.db.migrations.state import ModelState, ProjectState
+        from drvschema.checks import checkDrift
+
+        appschema = DrvSchema({'Test': {'role': {'type': 'string', 'allowed': ['a', 'b'], 'index': True}}})
+        meta = appschema.to('DjangoModelMetaKwargs', 'Test', copy=True)
+        constraintname = meta['constraints'][0].name
+        state = ProjectState()
+        state.add_model(ModelState('drv', 'test', [
+            ('id', models.AutoField(primary_key=True)),
+            ('role', models.CharField()),
+        ], options={'constraints': [], 'indexes': meta['indexes']}))
+        messages = checkDrift(appschema, 'drv', state)
+        self.assertTrue([message.id for message in messages] == ['drvschema.W002'])
+        self.assertTrue(messages[0].obj == 'drv.Test')
+        self.assertTrue(('Constraint %s' % constraintname) in messages[0].msg and 'not in the migrations' in messages[0].msg)
+
+        # Changed and stale constraints, and unrelated ones that are not checked
+        options = state.models[('drv', 'test')].options
+        options['constraints'] = [
+            models.CheckConstraint(name=constraintname, condition=models.Q(role__in=['a'])),
+            models.CheckConstraint(name='test_role_0123456789', condition=models.Q(role__in=['a'])),
+            models.CheckConstraint(name='custom', condition=models.Q(role__in=['a'])),
+        ]
+        messages = checkDrift(appschema, 'drv', state)
+        self.assertTrue(len(messages) == 2)
+        self.assertTrue('in the migrations' in messages[0].msg and constraintname in messages[0].msg)
+        self.assertTrue('test_role_0123456789' in messages[1].msg and 'not in the schema' in messages[1].msg)
+
+        options['constraints'] = meta['constraints']
+        self.assertTrue(checkDrift(appschema, 'drv', state) == [])
+
+
+if __name__ == '__main__':
+    unittest.main()
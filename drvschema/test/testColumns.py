@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+'''
+testColumns
+
+Test for columnar batch validation
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+import unittest
+from drvschema import DrvSchema
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+SCHEMATA = {
+    'User': {
+        'first_name': {
+            'type': 'string',
+            'required': True,
+            'maxlength': 5,
+            'empty': False,
+        },
+        'nickname': {
+            'type': 'string',
+            'nullable': True,
+            'maxlength': 3,
+        },
+        'email': {
+            'type': 'string',
+            'required': True,
+        },
+        'age': {
+            'type': 'integer',
+            'min': 0,
+        },
+    }
+}
+
+
+@unittest.skipUnless(np, 'NumPy is not installed')
+class TestColumns(unittest.TestCase):
+
+    def testValidateColumns(self):
+        """
+        Ensure per-row masks match what the compiled validator reports for each row
+        """
+        appschema = DrvSchema(SCHEMATA)
+        columns = {
+            'first_name': np.array(['Aaron', None, '', 'Bartholomew'], dtype=object),
+            'nickname': np.array([None, 'Al', 'Alexander', None], dtype=object),
+            'age': np.array([1, -1, 3, 4]),
+        }
+        masks = appschema.validate_columns('User', columns)
+
+        self.assertTrue(masks['first_name']['nullable'].tolist() == [False, True, False, False])
+        self.assertTrue(masks['first_name']['empty'].tolist() == [False, False, True, False])
+        self.assertTrue(masks['first_name']['maxlength'].tolist() == [False, False, False, True])
+        self.assertTrue(masks['nickname'] == {'maxlength': masks['nickname']['maxlength']})
+        self.assertTrue(masks['nickname']['maxlength'].tolist() == [False, False, True, False])
+        self.assertTrue(masks['email']['required'].all())
+        self.assertTrue(masks['age']['min'].tolist() == [False, True, False, False])
+
+        validate = appschema.compile_validator('User')
+        for row in range(4):
+            document = {field: column[row].item() if hasattr(column[row], 'item') else column[row] for field, column in columns.items()}
+            errors = validate(document)[1]
+            failing = {field for field, rules in masks.items() if any(mask[row] for mask in rules.values())}
+            self.assertTrue(set(errors) == failing, row)
+
+    def testStringColumns(self):
+        """
+        Ensure fixed width string columns use vectorized lengths
+        """
+        masks = DrvSchema(SCHEMATA).validate_columns('User', {
+            'first_name': np.array(['Aaron', 'Bartholomew']),
+            'email': np.array(['a@b.c', 'd@e.f']),
+        })
+        self.assertTrue(list(masks.keys()) == ['first_name'])
+        self.assertTrue(masks['first_name']['maxlength'].tolist() == [False, True])
+
+    def testReadonlyAndUnsizedColumns(self):
+        """
+        Ensure read-only columns fail every row, nulls included, and values without a
+        length are not checked by the empty and length rules, like the compiled validator
+        """
+        schemata = {'Item': {
+            'created': {'type': 'string', 'readonly': True},
+            'code': {'empty': False, 'maxlength': 2},
+        }}
+        appschema = DrvSchema(schemata)
+        columns = {
+            'created': np.array(['2018', None, '2019'], dtype=object),
+            'code': np.array([7, '', 'abc'], dtype=object),
+        }
+        masks = appschema.validate_columns('Item', columns)
+        self.assertTrue(masks['created']['readonly'].tolist() == [True, True, True])
+        self.assertTrue(masks['created']['nullable'].tolist() == [False, True, False])
+        self.assertTrue(masks['code']['empty'].tolist() == [False, True, False])
+        self.assertTrue(masks['code']['maxlength'].tolist() == [False, False, True])
+
+        validate = appschema.compile_validator('Item')
+        for row in range(3):
+            errors = validate({field: column[row] for field, column in columns.items()})[1]
+            failing = {(field, rule) for field, rules in masks.items() for rule, mask in rules.items() if mask[row]}
+            self.assertTrue(len(failing) == sum(len(messages) for messages in errors.values()), row)
+
+    def testObjectColumns(self):
+        """
+        Ensure min and max are checked entry by entry in object columns, skipping
+        nulls and values that cannot be compared, like the compiled validator
+        """
+        appschema = DrvSchema({'Item': {'count': {'nullable': True, 'min': 0, 'max': 10}}})
+        columns = {'count': np.array([5, -3, None, 50, 'x'], dtype=object)}
+        masks = appschema.validate_columns('Item', columns)
+        self.assertTrue(masks['count']['min'].tolist() == [False, True, False, False, False])
+        self.assertTrue(masks['count']['max'].tolist() == [False, False, False, True, False])
+
+        validate = appschema.compile_validator('Item')
+        for row in range(5):
+            errors = validate({'count': columns['count'][row]})[1]
+            failing = {rule for rule, mask in masks['count'].items() if mask[row]}
+            self.assertTrue(len(failing) == len(errors.get('count', [])), row)
@@ -105,6 +105,51 @@ class TestDjangoModels(unittest.TestCase):
         self.assertFalse(kwargs['default'])
         self.assertTrue(kwargs['help_text'] == 'Is the user enabled?')
 
+    def testMetaKwargs(self):
+        """
+        Ensure schema rules become check constraints and indexes with short names
+        """
+        from django.db import models
+
+        appschema = drvschema.DrvSchema({
+            'ScientificInstrument': {
+                'name': {
+                    'type': 'string',
+                    'maxlength': 100,
+                    'empty': False,
+                    'allowed': ['microscope', 'sequencer'],
+                    'index': True,
+                },
+                'description_text': {
+                    'type': 'string',
+                    'maxlength': 100,
+                    'min': 'a',
+                    'max': 'z',
+                    'regex': '[a-z]+',
+                },
+                'is_enabled': {
+                    'type': 'boolean',
+                },
+                'serial_number': {
+                    'type': 'integer',
+                    'empty': False,
+                    'min': 1,
+                },
+            }
+        })
+        kwargs = appschema.to('DjangoModelMetaKwargs', 'ScientificInstrument')
+        constraints = kwargs['constraints']
+        self.assertTrue(len(constraints) == 6)
+        self.assertTrue(all(isinstance(constraint, models.CheckConstraint) for constraint in constraints))
+        names = [constraint.name for constraint in constraints] + [index.name for index in kwargs['indexes']]
+        self.assertTrue(len(set(names)) == 7)
+        self.assertTrue(all(len(name) <= 30 and name.startswith('scientif_') for name in names))
+        self.assertTrue(kwargs['indexes'][0].fields == ['name'])
+
+        # empty only applies to strings; an integer field just gets its min constraint
+        serialnumber = [constraint for constraint in constraints if 'serial_number' in str(constraint)]
+        self.assertTrue(len(serialnumber) == 1 and 'serial_number__gte' in str(serialnumber[0]))
+
     def testMigration(self):
         """
         Do an actual migration with a Django model (drv project)
@@ -140,3 +185,47 @@ class Test(models.Model):
         proc = subprocess.Popen(cmd, stderr=subprocess.PIPE, stdout=subprocess.PIPE, shell=True, cwd=TEST_PROJECT_PATH)
         stdoutstr, stderrstr = proc.communicate()
         self.assertTrue(proc.returncode == 0, "Migration failed: \n%s\n%s" % (stdoutstr, stderrstr))
+
+    def testBuildModelMigration(self):
+        """
+        Do an actual migration with a Django model built by DrvSchema.build_model (drv project)
+        """
+        modelstext = r'''
+from drvschema import DrvSchema
+
+APPSCHEMA = DrvSchema({
+    'Test': {
+        'name': {
+            'type': 'string',
+            'required': True,
+            'maxlength': 100,
+            'empty': False,
+            'regex': '[A-Za-z ]+',
+            'index': True,
+        },
+        'status': {
+            'type': 'string',
+            'maxlength': 10,
+            'allowed': ['new', 'done'],
+            'default': 'new',
+        },
+        'is_enabled': {
+            'type': 'boolean',
+            'default': False,
+        },
+        'created': {
+            'type': 'datetime',
+            'readonly': True,
+        }
+    }
+})
+
+Test = APPSCHEMA.build_model('Test')
+        '''
+        with open(TEST_PROJECT_MODEL_PATH, 'w') as f:
+            f.write(modelstext)
+
+        cmd = './manage.py makemigrations drv && ./manage.py migrate'
+        proc = subprocess.Popen(cmd, stderr=subprocess.PIPE, stdout=subprocess.PIPE, shell=True, cwd=TEST_PROJECT_PATH)
+        stdoutstr, stderrstr = proc.communicate()
+        self.assertTrue(proc.returncode == 0, "Migration failed: \n%s\n%s" % (stdoutstr, stderrstr))
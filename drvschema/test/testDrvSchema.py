@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+
+'''
+testDrvSchema
+
+Test for the DrvSchema class and schemata lookups
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+import unittest
+from drvschema import DrvSchema, converter, fieldspec
+
+
+SCHEMATA = {
+    'User': {
+        'first_name': {
+            'type': 'string',
+            'required': True,
+            'maxlength': 200,
+            'help': 'User first name',
+        },
+        'is_enabled': {
+            'type': 'boolean',
+            'default': False,
+        },
+    }
+}
+
+NESTED_SCHEMATA = {
+    'Order': {
+        'address': {
+            'type': 'dict',
+            'schema': {
+                'city': {'type': 'string', 'required': True, 'maxlength': 50},
+                'street': {'type': 'string'},
+            },
+        },
+        'items': {
+            'type': 'list',
+            'required': True,
+            'schema': {
+                'type': 'dict',
+                'schema': {
+                    'sku': {'type': 'string', 'required': True, 'maxlength': 20},
+                    'gift': {'type': 'boolean'},
+                },
+            },
+        },
+        'prices': {
+            'type': 'dict',
+            'valuesrules': {'type': 'float'},
+        },
+    }
+}
+
+
+class TestDrvSchema(unittest.TestCase):
+
+    def testSchemaIndex(self):
+        """
+        Ensure the compiled index returns the same elements as walking the schemata
+        """
+        appschema = DrvSchema(SCHEMATA)
+        for keystr in ('User', 'User.first_name', 'User.is_enabled', 'User.first_name.maxlength'):
+            self.assertTrue(converter.getSchemaFromKeys(appschema.index, keystr) == converter.getSchemaFromKeys(SCHEMATA, keystr))
+        self.assertTrue(appschema.index['User.first_name'] is SCHEMATA['User']['first_name'])
+
+        with self.assertRaises(Exception):
+            converter.getSchemaFromKeys(appschema.index, 'User.middle_name')
+
+    def testNestedPaths(self):
+        """
+        Ensure paths resolve through nested schema and valuesrules rules and are memoized in the index
+        """
+        appschema = DrvSchema(NESTED_SCHEMATA)
+        order = NESTED_SCHEMATA['Order']
+        self.assertTrue(converter.getSchemaFromKeys(appschema.index, 'Order.items.[].sku') is order['items']['schema']['schema']['sku'])
+        self.assertTrue('Order.items.[]' in appschema.index)
+        self.assertTrue(converter.getSchemaFromKeys(appschema.index, 'Order.address.city.maxlength') == 50)
+        self.assertTrue(converter.getSchemaFromKeys(NESTED_SCHEMATA, 'Order.prices.[]') == {'type': 'float'})
+        self.assertTrue(converter.getSchemaFromKeys(NESTED_SCHEMATA, 'Order.address.schema.street') == {'type': 'string'})
+        with self.assertRaises(Exception):
+            converter.getSchemaFromKeys(appschema.index, 'Order.address.[]')
+
+        self.assertTrue(appschema.to_many('DjangoModel', 'Order.items.[]')['sku'] == {'max_length': 20, 'default': None, 'null': False})
+        self.assertTrue(appschema.to_many('DjangoModel', 'Order')['items'] == {})
+        self.assertTrue(
+            appschema.to('VuelidateValidations', 'Order') ==
+            '{address: {city: {required, maxLength: maxLength(50)}}, '
+            'items: {required, $each: {sku: {required, maxLength: maxLength(20)}}}}'
+        )
+
+    def testValidate(self):
+        """
+        Ensure eager validation rejects malformed schemata
+        """
+        DrvSchema(SCHEMATA, validate=True)
+        with self.assertRaises(Exception):
+            DrvSchema({'User': {'first_name': 'string'}}, validate=True)
+        with self.assertRaises(Exception):
+            DrvSchema({'User': {'first_name': {'maxlength': '200'}}}, validate=True)
+
+    def testResultCache(self):
+        """
+        Ensure converter results are cached, read-only and invalidated on demand
+        """
+        schemata = {'User': {'first_name': {'maxlength': 200}}}
+        appschema = DrvSchema(schemata)
+
+        kwargs = appschema.to('DjangoModelCharFieldKwargs', 'User.first_name')
+        self.assertTrue(appschema.to('DjangoModelCharFieldKwargs', 'User.first_name') is kwargs)
+        self.assertTrue(appschema.cacheInfo() == {'hits': 1, 'misses': 1, 'size': 1})
+        with self.assertRaises(TypeError):
+            kwargs['max_length'] = 10
+
+        kwargscopy = appschema.to('DjangoModelCharFieldKwargs', 'User.first_name', copy=True)
+        kwargscopy['max_length'] = 10
+        self.assertTrue(appschema.to('DjangoModelCharFieldKwargs', 'User.first_name')['max_length'] == 200)
+
+        # Nested dictionaries and lists are read-only as well
+        jsonschema = appschema.to('JSONSchema', 'User')
+        with self.assertRaises(TypeError):
+            jsonschema['properties']['first_name']['maxLength'] = 999
+        with self.assertRaises(AttributeError):
+            appschema.to('DjangoModelMetaKwargs', 'User')['constraints'].append(None)
+        jsonschemacopy = appschema.to('JSONSchema', 'User', copy=True)
+        jsonschemacopy['properties']['first_name']['maxLength'] = 999
+        self.assertTrue(appschema.to('JSONSchema', 'User')['properties']['first_name']['maxLength'] == 200)
+
+        schemata['User']['first_name']['maxlength'] = 100
+        appschema.invalidate()
+        self.assertTrue(appschema.to('DjangoModelCharFieldKwargs', 'User.first_name')['max_length'] == 100)
+        self.assertTrue(appschema.cacheInfo()['misses'] == 1)
+
+    def testToMany(self):
+        """
+        Ensure a whole type is converted with the converter matching each field's type
+        """
+        appschema = DrvSchema(SCHEMATA)
+
+        results = appschema.to_many('DjangoModel', 'User')
+        self.assertTrue(results['first_name'] == appschema.to('DjangoModelCharFieldKwargs', 'User.first_name'))
+        self.assertTrue(results['is_enabled'] == appschema.to('DjangoModelBooleanFieldKwargs', 'User.is_enabled'))
+
+        results = appschema.to_many('DRFSerializerCharFieldKwargs', 'User')
+        self.assertTrue(set(results.keys()) == {'first_name', 'is_enabled'})
+
+        results = appschema.convert_all('DRFSerializer')
+        self.assertTrue(results['User']['is_enabled']['default'] is False)
+        self.assertTrue(results['User']['first_name']['max_length'] == 200)
+
+        # Common scalar types have converters and fields of other types are skipped
+        appschema = DrvSchema({'User': {
+            'age': {'type': 'integer', 'min': 0, 'required': False},
+            'score': {'type': 'float', 'readonly': True},
+            'born': {'type': 'date'},
+            'avatar': {'type': 'binary'},
+            'code': {'type': ['string', 'integer']},
+            'nickname': {'type': ['string'], 'maxlength': 10},
+        }})
+        results = appschema.to_many('DjangoModel', 'User')
+        self.assertTrue(set(results.keys()) == {'age', 'score', 'born', 'nickname'})
+        self.assertTrue(results['nickname'] == {'max_length': 10})
+        self.assertTrue(set(appschema.convert_all('DRFSerializer')['User']) == set(results))
+        appschema.freeze(gc_freeze=False)
+        self.assertTrue(results['age'] == {'null': True})
+        self.assertTrue(results['score'] == {'editable': False})
+        self.assertTrue(appschema.to_many('DRFSerializer', 'User')['age'] == {'required': False, 'min_value': 0})
+        with self.assertRaises(Exception):
+            converter.getFieldClassName({'type': 'binary'})
+
+    def testInstrument(self):
+        """
+        Ensure instrumentation counts calls and hot keys and calls the hook
+        """
+        appschema = DrvSchema(SCHEMATA)
+        with self.assertRaises(Exception):
+            appschema.stats()
+
+        calls = []
+        appschema.instrument(hook=lambda *args: calls.append(args))
+        for i in range(3):
+            appschema.to('DjangoModelCharFieldKwargs', 'User.first_name')
+        appschema.to_many('DjangoModel', 'User')
+
+        stats = appschema.stats()
+        charfield = stats['converters']['DjangoModelCharFieldKwargs']
+        self.assertTrue((charfield['calls'], charfield['hits'], charfield['misses']) == (4, 3, 1))
+        self.assertTrue(charfield['max'] <= charfield['total'])
+        self.assertTrue(stats['converters']['DjangoModelBooleanFieldKwargs']['calls'] == 1)
+        self.assertTrue(stats['hotKeys'] == [('DjangoModelCharFieldKwargs', 'User.first_name', 4)])
+        self.assertTrue(len(calls) == 5 and calls[0][3] is False and calls[1][3] is True)
+
+        appschema.instrument(False)
+        self.assertTrue('to' not in appschema.__dict__)
+
+    def testFieldSpec(self):
+        """
+        Ensure fields are normalized into cached, immutable FieldSpecs
+        """
+        schemata = {
+            'User': {'first_name': {'maxlength': 200, 'default': None}},
+            'Group': {'name': {'default': None, 'maxlength': 200}},
+        }
+        appschema = DrvSchema(schemata)
+
+        spec = converter.getFieldSpec(appschema.index, 'User.first_name')
+        self.assertTrue(spec.maxlength == 200)
+        self.assertTrue(spec.default is None)
+        self.assertTrue(spec.required is fieldspec.MISSING)
+        self.assertTrue(spec.rules is schemata['User']['first_name'])
+        self.assertTrue(converter.getFieldSpec(appschema.index, 'User.first_name') is spec)
+        self.assertTrue(converter.getFieldSpec(appschema.index, 'Group.name').maxlength == 200)
+        with self.assertRaises(AttributeError):
+            spec.maxlength = 10
+        with self.assertRaises(AttributeError):
+            spec.extra = 1
+
+        self.assertTrue(converter.getFieldSpec(schemata, 'User.first_name').maxlength == 200)
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+
+'''
+testFreeze
+
+Test for frozen DrvSchemas shared with forked workers
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+import unittest
+import gc
+import os
+from drvschema import DrvSchema
+from drvschema.benchmark import syntheticSchemata
+
+
+SMAPS_ROLLUP = '/proc/self/smaps_rollup'
+
+
+def getPrivateDirty():
+    """
+    Private dirty memory of this process in kB
+    """
+    total = 0
+    with open(SMAPS_ROLLUP, 'r') as f:
+        for line in f:
+            if line.startswith('Private_Dirty:'):
+                total += int(line.split()[1])
+    return total
+
+
+def getForkedGrowth(freeze):
+    """
+    Fork after building (and optionally freezing) a large DrvSchema, convert every
+    field in the child and return the child's private dirty memory growth in kB
+    """
+    schemata = syntheticSchemata(20000)
+    appschema = DrvSchema(schemata)
+    keys = ['%s.%s' % (typename, field) for typename, fields in schemata.items() for field, schema in fields.items() if schema['type'] == 'string']
+    if freeze:
+        appschema.freeze(gc_freeze=False)
+    gc.freeze()
+
+    try:
+        readfd, writefd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                before = getPrivateDirty()
+                for keystr in keys:
+                    appschema.to('DjangoModelCharFieldKwargs', keystr)
+                    appschema.to('DRFSerializerCharFieldKwargs', keystr)
+                for typename in schemata:
+                    appschema.to('VuelidateValidations', typename)
+                os.write(writefd, str(getPrivateDirty() - before).encode('utf-8'))
+            finally:
+                os._exit(0)
+
+        os.close(writefd)
+        os.waitpid(pid, 0)
+        with os.fdopen(readfd, 'rb') as f:
+            return int(f.read())
+    finally:
+        gc.unfreeze()
+
+
+class TestFreeze(unittest.TestCase):
+
+    def testFreeze(self):
+        """
+        Ensure a frozen DrvSchema returns the same results and is not written to by lookups
+        """
+        schemata = syntheticSchemata(100)
+        appschema = DrvSchema(schemata)
+        expected = appschema.to('DRFSerializerCharFieldKwargs', 'Type0.field0')
+
+        frozen = DrvSchema(schemata)
+        frozen.freeze(gc_freeze=False)
+        self.assertTrue(frozen.to('DRFSerializerCharFieldKwargs', 'Type0.field0') == expected)
+        self.assertTrue(frozen.to('VuelidateValidations', 'Type1') == appschema.to('VuelidateValidations', 'Type1'))
+
+        info = frozen.cacheInfo()
+        frozen.to('DjangoModelCharFieldKwargs', 'Type0.field0')
+        frozen.to('DjangoModelForeignKeyFieldKwargs', 'Type0.field0')
+        self.assertTrue(frozen.cacheInfo() == info)
+        with self.assertRaises(Exception):
+            frozen.invalidate()
+        with self.assertRaises(Exception):
+            frozen.instrument()
+
+    @unittest.skipUnless(hasattr(os, 'fork') and os.path.exists(SMAPS_ROLLUP), 'Needs fork and /proc/self/smaps_rollup')
+    def testForkedMemory(self):
+        """
+        Ensure lookups in a forked child of a frozen DrvSchema dirty far fewer pages
+        """
+        unfrozen = getForkedGrowth(False)
+        frozen = getForkedGrowth(True)
+        self.assertTrue(frozen * 2 < unfrozen, 'frozen %dkB, unfrozen %dkB' % (frozen, unfrozen))
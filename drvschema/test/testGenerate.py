@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+'''
+testGenerate
+
+Test for ahead-of-time generation of kwargs and Vuelidate modules
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+import unittest
+import copy
+import json
+import os
+import shutil
+import tempfile
+import drvschema
+from drvschema import DrvSchema, converter, registry
+from drvschema.export import export
+from drvschema.generate import Generator, Watcher
+from drvschema.__main__ import main
+
+
+SCHEMATA = {
+    'User': {
+        'first_name': {
+            'type': 'string',
+            'required': True,
+            'maxlength': 200,
+            'help': 'User first name',
+        },
+        'is_enabled': {
+            'type': 'boolean',
+            'default': False,
+        },
+    }
+}
+
+
+def DjangoModelCharFieldKwargs(schemata, keystr):
+    """
+    Custom converter that marks the CharField kwargs it returns
+    """
+    kwargs = converter.DjangoModelCharFieldKwargs(schemata, keystr)
+    kwargs['db_comment'] = 'custom'
+    return kwargs
+
+
+class TestGenerate(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def testGeneratedModule(self):
+        """
+        Ensure the generated module holds the converter results as literals and is only rewritten on change
+        """
+        appschema = DrvSchema(SCHEMATA)
+        pythonpath = os.path.join(self.tmpdir, 'schema_kwargs.py')
+        jspath = os.path.join(self.tmpdir, 'validations.js')
+
+        self.assertTrue(Generator(appschema).write(pythonpath, jspath) == [pythonpath, jspath])
+        namespace = {}
+        with open(pythonpath, 'r') as f:
+            exec(f.read(), namespace)
+        self.assertTrue(namespace['DJANGO_MODEL_KWARGS']['User'] == appschema.to_many('DjangoModel', 'User'))
+        self.assertTrue(namespace['DRF_SERIALIZER_KWARGS']['User'] == appschema.to_many('DRFSerializer', 'User'))
+        with open(jspath, 'r') as f:
+            self.assertTrue('export const User = ' in f.read())
+
+        self.assertTrue(Generator(DrvSchema(SCHEMATA)).write(pythonpath, jspath) == [])
+
+    def testGenerateCommand(self):
+        """
+        Ensure the generate command reads a JSON schemata file
+        """
+        schemapath = os.path.join(self.tmpdir, 'schema.json')
+        pythonpath = os.path.join(self.tmpdir, 'schema_kwargs.py')
+        with open(schemapath, 'w') as f:
+            json.dump(SCHEMATA, f)
+
+        self.assertTrue(main(['generate', '--schema', schemapath, '--python', pythonpath]) == 0)
+        self.assertTrue(os.path.exists(pythonpath))
+
+    def testDiff(self):
+        """
+        Ensure added, removed and changed paths and affected types are reported
+        """
+        new = copy.deepcopy(SCHEMATA)
+        new['User']['first_name']['maxlength'] = 100
+        new['User']['email'] = {'type': 'string'}
+        del new['User']['is_enabled']
+        new['Group'] = {'name': {'type': 'string'}}
+
+        schemadiff = drvschema.diff(SCHEMATA, DrvSchema(new))
+        self.assertTrue(schemadiff.added == ['Group', 'User.email'])
+        self.assertTrue(schemadiff.removed == ['User.is_enabled'])
+        self.assertTrue(schemadiff.changed == ['User.first_name'])
+        self.assertTrue(schemadiff.types == {'Group', 'User'})
+        self.assertFalse(drvschema.diff(SCHEMATA, copy.deepcopy(SCHEMATA)))
+
+    def testWatcher(self):
+        """
+        Ensure a changed schemata file only re-renders the changed types
+        """
+        schemata = dict(copy.deepcopy(SCHEMATA), Group={'name': {'type': 'string', 'maxlength': 10}})
+        schemapath = os.path.join(self.tmpdir, 'schema.json')
+        pythonpath = os.path.join(self.tmpdir, 'schema_kwargs.py')
+        with open(schemapath, 'w') as f:
+            json.dump(schemata, f)
+
+        watcher = Watcher(schemapath, pythonpath)
+        watcher.write()
+        self.assertTrue(watcher.poll() is None)
+
+        rendered = []
+        renderType = watcher.generator.renderType
+        watcher.generator.renderType = lambda typename: rendered.append(typename) or renderType(typename)
+
+        schemata['Group']['name']['maxlength'] = 20
+        with open(schemapath, 'w') as f:
+            json.dump(schemata, f, indent=2)
+        schemadiff = watcher.poll()
+        self.assertTrue(schemadiff.changed == ['Group.name'])
+        self.assertTrue(rendered == ['Group'])
+
+        namespace = {}
+        with open(pythonpath, 'r') as f:
+            exec(f.read(), namespace)
+        self.assertTrue(namespace['DJANGO_MODEL_KWARGS']['Group']['name']['max_length'] == 20)
+
+    def testParallelExport(self):
+        """
+        Ensure the process pool export writes the same bytes as the serial export
+        """
+        appschema = DrvSchema({'User%d' % i: copy.deepcopy(SCHEMATA['User']) for i in range(50)})
+        serialdir = os.path.join(self.tmpdir, 'serial')
+        paralleldir = os.path.join(self.tmpdir, 'parallel')
+
+        written = export(appschema, serialdir, targets=['django', 'drf', 'vuelidate'], workers=1)
+        self.assertTrue(len(written) == 3)
+        export(appschema, paralleldir, workers=3)
+        for filename in os.listdir(serialdir):
+            with open(os.path.join(serialdir, filename), 'rb') as serial, open(os.path.join(paralleldir, filename), 'rb') as parallel:
+                self.assertTrue(serial.read() == parallel.read(), filename)
+
+        # The workers use the DrvSchema's custom converters
+        converters = dict(registry.converters)
+        converters['DjangoModelCharFieldKwargs'] = DjangoModelCharFieldKwargs
+        appschema = DrvSchema(appschema.schemata, converters=converters)
+        export(appschema, serialdir, targets=['django'], workers=1)
+        export(appschema, paralleldir, targets=['django'], workers=3)
+        with open(os.path.join(serialdir, 'django_kwargs.py'), 'rb') as serial, open(os.path.join(paralleldir, 'django_kwargs.py'), 'rb') as parallel:
+            serialbytes = serial.read()
+            self.assertTrue(b"'db_comment': 'custom'" in serialbytes)
+            self.assertTrue(serialbytes == parallel.read())
+
+        # Converters that cannot be pickled are rendered in this process
+        converters['DjangoModelCharFieldKwargs'] = lambda schemata, keystr: DjangoModelCharFieldKwargs(schemata, keystr)
+        appschema = DrvSchema(appschema.schemata, converters=converters)
+        export(appschema, paralleldir, targets=['django'], workers=3)
+        with open(os.path.join(paralleldir, 'django_kwargs.py'), 'rb') as parallel:
+            self.assertTrue(serialbytes == parallel.read())
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+'''
+testJsonSchema
+
+Test for the JSON Schema converter and OpenAPI components export
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+import unittest
+import io
+import json
+from drvschema import DrvSchema
+from drvschema.jsonschema import getComponents, writeComponents
+
+
+SCHEMATA = {
+    'User': {
+        'first_name': {
+            'type': 'string',
+            'required': True,
+            'maxlength': 200,
+            'help': 'User first name',
+        },
+        'role': {
+            'type': 'string',
+            'allowed': ['admin', 'user'],
+            'nullable': True,
+        },
+        'created': {
+            'type': 'datetime',
+            'readonly': True,
+        },
+        'tags': {
+            'type': 'list',
+            'maxlength': 5,
+            'schema': {'type': 'string', 'regex': '[a-z]+'},
+        },
+        'labels': {
+            'type': 'list',
+            'allowed': ['a', 'b'],
+            'schema': {'type': 'string'},
+        },
+        'address': {
+            'type': 'dict',
+            'schema': {
+                'city': {'type': 'string', 'required': True},
+            },
+        },
+    },
+}
+
+
+class TestJsonSchema(unittest.TestCase):
+
+    def testJSONSchema(self):
+        """
+        Ensure types and nested fields are converted to JSON Schema and cached
+        """
+        appschema = DrvSchema(SCHEMATA)
+        result = appschema.to('JSONSchema', 'User')
+        self.assertTrue(appschema.to('JSONSchema', 'User') is result)
+        result = appschema.to('JSONSchema', 'User', copy=True)
+        self.assertTrue(result['required'] == ['first_name'])
+        self.assertTrue(result['additionalProperties'] is False)
+        properties = result['properties']
+        self.assertTrue(properties['first_name'] == {'type': 'string', 'description': 'User first name', 'maxLength': 200})
+        self.assertTrue(properties['role'] == {'type': ['string', 'null'], 'enum': ['admin', 'user', None]})
+        self.assertTrue(properties['created'] == {'type': 'string', 'format': 'date-time', 'readOnly': True})
+        self.assertTrue(properties['tags'] == {'type': 'array', 'maxItems': 5, 'items': {'type': 'string', 'pattern': '^(?:[a-z]+)$'}})
+        self.assertTrue(properties['labels'] == {'type': 'array', 'items': {'type': 'string', 'enum': ['a', 'b']}})
+        self.assertTrue(properties['address']['properties'] == {'city': {'type': 'string'}})
+        self.assertTrue(properties['address']['required'] == ['city'])
+        self.assertTrue(appschema.to('JSONSchema', 'User.address.city') == {'type': 'string'})
+
+    def testComponents(self):
+        """
+        Ensure the streamed components are the same as the components object
+        """
+        appschema = DrvSchema(SCHEMATA)
+        stream = io.StringIO()
+        writeComponents(appschema, stream)
+        self.assertTrue(json.loads(stream.getvalue()) == getComponents(appschema))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+
+'''
+testLazy
+
+Test for lazily loaded per-type schemata
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+import unittest
+import copy
+import json
+import os
+import shutil
+import tempfile
+from drvschema import DrvSchema
+
+
+SCHEMATA = {
+    'User': {
+        'first_name': {
+            'type': 'string',
+            'required': True,
+            'maxlength': 200,
+        },
+    },
+    'Group': {
+        'name': {
+            'type': 'string',
+            'maxlength': 20,
+        },
+    },
+    'Project': {
+        'title': {
+            'type': 'string',
+            'maxlength': 100,
+        },
+    },
+}
+
+
+class TestLazy(unittest.TestCase):
+
+    def setUp(self):
+        self.loaded = []
+
+    def loader(self, typename):
+        self.loaded.append(typename)
+        return copy.deepcopy(SCHEMATA[typename])
+
+    def testLoader(self):
+        """
+        Ensure types are only loaded on first use and evicted least recently used first
+        """
+        appschema = DrvSchema(loader=self.loader, max_types=2, typenames=list(SCHEMATA))
+        self.assertTrue(self.loaded == [])
+        self.assertTrue(list(appschema.schemata) == ['User', 'Group', 'Project'])
+
+        self.assertTrue(appschema.to('DjangoModelCharFieldKwargs', 'User.first_name')['max_length'] == 200)
+        self.assertTrue(appschema.to('DjangoModelCharFieldKwargs', 'Group.name')['max_length'] == 20)
+        appschema.to('DjangoModelCharFieldKwargs', 'User.first_name')
+        self.assertTrue(self.loaded == ['User', 'Group'])
+
+        # Group is now the least recently used type
+        appschema.to('DjangoModelCharFieldKwargs', 'Project.title')
+        self.assertTrue(list(appschema.schemata.loaded) == ['User', 'Project'])
+        self.assertFalse(any(keystr.startswith('Group') for keystr in appschema.index))
+        self.assertFalse(any(keystr.startswith('Group') for name, keystr in appschema.cache))
+        self.assertTrue(('DjangoModelCharFieldKwargs', 'User.first_name') in appschema.cache)
+
+        self.assertTrue(appschema.to('DjangoModelCharFieldKwargs', 'Group.name')['max_length'] == 20)
+        self.assertTrue(self.loaded == ['User', 'Group', 'Project', 'Group'])
+        with self.assertRaises(Exception):
+            appschema.to('DjangoModelCharFieldKwargs', 'Nobody.name')
+        with self.assertRaises(Exception):
+            appschema.freeze()
+
+    def testCustomConverters(self):
+        """
+        Ensure converters that index their schemata argument work as without a loader
+        """
+        converters = {
+            'Help': lambda schemata, keystr: schemata[keystr].get('maxlength'),
+            'Nested': lambda schemata, keystr: schemata['User']['first_name']['maxlength'],
+            'Other': lambda schemata, keystr: schemata['Group.name']['maxlength'],
+        }
+        eager = DrvSchema(copy.deepcopy(SCHEMATA), converters=converters)
+        appschema = DrvSchema(loader=self.loader, max_types=1, typenames=list(SCHEMATA), converters=converters)
+        for name in converters:
+            self.assertTrue(appschema.to(name, 'User.first_name') == eager.to(name, 'User.first_name'), name)
+        self.assertTrue(list(appschema.schemata.loaded) == ['Group'])
+        with self.assertRaises(KeyError):
+            appschema.to('Help', 'Nobody.name')
+
+    def testDirectoryLoader(self):
+        """
+        Ensure per-type schema files are read from a directory on first use and validated
+        """
+        tmpdir = tempfile.mkdtemp()
+        try:
+            for typename, typeschema in SCHEMATA.items():
+                with open(os.path.join(tmpdir, '%s.json' % typename), 'w') as f:
+                    json.dump(typeschema, f)
+            with open(os.path.join(tmpdir, 'Broken.json'), 'w') as f:
+                json.dump({'name': {'maxlength': '20'}}, f)
+
+            appschema = DrvSchema(loader=tmpdir, validate=True)
+            self.assertTrue(list(appschema.schemata) == ['Broken', 'Group', 'Project', 'User'])
+            self.assertTrue(appschema.to_many('DjangoModel', 'User') == {'first_name': {'max_length': 200, 'default': None, 'null': False}})
+            self.assertTrue(list(appschema.schemata.loaded) == ['User'])
+            with self.assertRaises(Exception):
+                appschema.to_many('DjangoModel', 'Broken')
+        finally:
+            shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    unittest.main()
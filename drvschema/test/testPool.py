@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+
+'''
+testPool
+
+Test for pooled Cerberus validators
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from drvschema import DrvSchema
+from drvschema.pool import getCerberusSchema
+
+try:
+    import cerberus
+except ImportError:
+    cerberus = None
+
+
+SCHEMATA = {
+    'User': {
+        'first_name': {
+            'type': 'string',
+            'required': True,
+            'maxlength': 10,
+            'help': 'User first name',
+            'index': True,
+        },
+        'address': {
+            'type': 'dict',
+            'schema': {
+                'city': {'type': 'string', 'unique': False, 'vuelidate': ['alpha']},
+            },
+        },
+    }
+}
+
+
+class TestPool(unittest.TestCase):
+
+    def testCerberusSchema(self):
+        """
+        Ensure drvschema annotations are removed from nested fields too
+        """
+        self.assertTrue(getCerberusSchema(SCHEMATA['User']) == {
+            'first_name': {'type': 'string', 'required': True, 'maxlength': 10},
+            'address': {'type': 'dict', 'schema': {'city': {'type': 'string'}}},
+        })
+        self.assertTrue('help' in SCHEMATA['User']['first_name'])
+
+    @unittest.skipUnless(cerberus, 'Cerberus is not installed')
+    def testValidator(self):
+        """
+        Ensure pooled validators are reused, reset and safe to use from threads
+        """
+        appschema = DrvSchema(SCHEMATA)
+        with appschema.validator('User') as validator:
+            self.assertFalse(validator.validate({'first_name': 'x' * 11}))
+            self.assertTrue(validator.errors == {'first_name': ['max length is 10']})
+            first = validator
+        self.assertTrue(first.document is None)
+
+        with appschema.validator('User') as validator:
+            self.assertTrue(validator is first)
+            self.assertTrue(validator.validate({'first_name': 'Aaron', 'address': {'city': 'Boston'}}))
+            with appschema.validator('User') as other:
+                self.assertTrue(other is not first and other.schema is first.schema)
+
+        def validate(i):
+            with appschema.validator('User') as validator:
+                return validator.validate({'first_name': 'x' * (i % 12)})
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(validate, range(240)))
+        self.assertTrue(results == [i % 12 <= 10 for i in range(240)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+'''
+testRegistry
+
+Test for the converter registry and lazy package import
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+import unittest
+import json
+import os
+import subprocess
+import sys
+from drvschema import DrvSchema, registry
+
+
+# Modules that may be imported by importing drvschema and converting a field
+CORE_MODULES = {'drvschema', 'drvschema.drvschema', 'drvschema.converter', 'drvschema.fieldspec', 'drvschema.registry'}
+
+# Optional dependencies that must not be imported by the core
+OPTIONAL_MODULES = {'django', 'rest_framework', 'numpy', 'cerberus', 'yaml'}
+
+IMPORT_SCRIPT = r'''
+import json, sys, time
+started = time.perf_counter()
+import drvschema
+elapsed = time.perf_counter() - started
+drvschema.DrvSchema({'User': {'name': {'maxlength': 10}}}).to('DjangoModelCharFieldKwargs', 'User.name')
+print(json.dumps({'elapsed': elapsed, 'modules': sorted(sys.modules)}))
+'''
+
+
+class TestRegistry(unittest.TestCase):
+
+    def testRegister(self):
+        """
+        Ensure registered converters are available to DrvSchema by name
+        """
+        @registry.register('TestHelpText')
+        def TestHelpText(schemata, keystr):
+            return 'help: %s' % schemata[keystr]['help']
+
+        try:
+            appschema = DrvSchema({'User': {'name': {'help': 'Name'}}})
+            self.assertTrue(appschema.to('TestHelpText', 'User.name') == 'help: Name')
+            self.assertTrue(registry.get('DjangoModelCharFieldKwargs').__name__ == 'DjangoModelCharFieldKwargs')
+        finally:
+            del registry.converters.entries['TestHelpText']
+
+    def testConverters(self):
+        """
+        Ensure a converters dictionary replaces the registered converters
+        """
+        appschema = DrvSchema({'User': {'name': {'help': 'Name'}}}, converters={'Help': lambda schemata, keystr: schemata[keystr]['help']})
+        self.assertTrue(appschema.to('Help', 'User.name') == 'Name')
+        with self.assertRaises(Exception):
+            appschema.to('DjangoModelCharFieldKwargs', 'User.name')
+
+    def testImport(self):
+        """
+        Ensure importing drvschema and converting a field only imports the core
+        """
+        env = dict(os.environ, PYTHONPATH=os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+        output = subprocess.check_output([sys.executable, '-c', IMPORT_SCRIPT], env=env)
+        result = json.loads(output.decode('utf-8'))
+        modules = set(result['modules'])
+
+        self.assertTrue({m for m in modules if m.startswith('drvschema')} == CORE_MODULES, modules)
+        self.assertFalse({m.split('.')[0] for m in modules} & OPTIONAL_MODULES)
+        self.assertTrue(result['elapsed'] < 0.5, result['elapsed'])
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+'''
+testSchemaFile
+
+Test for loading schemata files with the compiled schema cache
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+import unittest
+import json
+import os
+import pickle
+import shutil
+import tempfile
+from drvschema import DrvSchema, converter
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+
+SCHEMATA = {
+    'User': {
+        'first_name': {
+            'type': 'string',
+            'required': True,
+            'maxlength': 200,
+        },
+    }
+}
+
+
+class TestSchemaFile(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.cachedir = os.path.join(self.tmpdir, 'cache')
+        self.schemapath = os.path.join(self.tmpdir, 'schema.json')
+        with open(self.schemapath, 'w') as f:
+            json.dump(SCHEMATA, f)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def testCache(self):
+        """
+        Ensure the compiled schemata is cached and read back from the cache
+        """
+        appschema = DrvSchema.from_file(self.schemapath, cache_dir=self.cachedir)
+        self.assertTrue(appschema.to('DjangoModelCharFieldKwargs', 'User.first_name')['max_length'] == 200)
+
+        cachefiles = os.listdir(self.cachedir)
+        self.assertTrue(len(cachefiles) == 1)
+
+        # Replace the cached schemata to prove that the cache, not the file, is read
+        cached = {'User': {'first_name': {'maxlength': 10}}}
+        with open(os.path.join(self.cachedir, cachefiles[0]), 'wb') as f:
+            pickle.dump(cached, f)
+        appschema = DrvSchema.from_file(self.schemapath, cache_dir=self.cachedir)
+        self.assertTrue(appschema.to('DjangoModelCharFieldKwargs', 'User.first_name')['max_length'] == 10)
+
+        # A changed file gets a new cache entry
+        with open(self.schemapath, 'w') as f:
+            json.dump({'User': {'first_name': {'maxlength': 20}}}, f)
+        appschema = DrvSchema.from_file(self.schemapath, cache_dir=self.cachedir)
+        self.assertTrue(appschema.to('DjangoModelCharFieldKwargs', 'User.first_name')['max_length'] == 20)
+        self.assertTrue(len(os.listdir(self.cachedir)) == 2)
+
+    def testCorruptCache(self):
+        """
+        Ensure a corrupt cache file is ignored and rewritten
+        """
+        DrvSchema.from_file(self.schemapath, cache_dir=self.cachedir)
+        cachepath = os.path.join(self.cachedir, os.listdir(self.cachedir)[0])
+        with open(cachepath, 'wb') as f:
+            f.write(b'not a pickle')
+
+        appschema = DrvSchema.from_file(self.schemapath, cache_dir=self.cachedir)
+        self.assertTrue(appschema.index['User.first_name']['maxlength'] == 200)
+        with open(cachepath, 'rb') as f:
+            self.assertTrue(pickle.load(f) == SCHEMATA)
+
+    def testStaleCache(self):
+        """
+        Ensure a cache file in an older format, with a pickled index of an older
+        SchemaIndex layout, is ignored and rewritten
+        """
+        DrvSchema.from_file(self.schemapath, cache_dir=self.cachedir)
+        cachepath = os.path.join(self.cachedir, os.listdir(self.cachedir)[0])
+        stale = converter.buildSchemaIndex(SCHEMATA)
+        del stale.specs
+        with open(cachepath, 'wb') as f:
+            pickle.dump((SCHEMATA, stale), f)
+
+        appschema = DrvSchema.from_file(self.schemapath, cache_dir=self.cachedir)
+        self.assertTrue(appschema.to('DjangoModelCharFieldKwargs', 'User.first_name')['max_length'] == 200)
+        with open(cachepath, 'rb') as f:
+            self.assertTrue(pickle.load(f) == SCHEMATA)
+
+    @unittest.skipUnless(yaml, 'PyYAML is not installed')
+    def testYaml(self):
+        """
+        Ensure YAML schemata files are parsed
+        """
+        path = os.path.join(self.tmpdir, 'schema.yaml')
+        with open(path, 'w') as f:
+            yaml.safe_dump(SCHEMATA, f)
+        self.assertTrue(DrvSchema.from_file(path).schemata == SCHEMATA)
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+
+'''
+testStream
+
+Test for streaming NDJSON and CSV validation
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+import unittest
+from datetime import datetime, timezone
+import io
+import json
+from drvschema import DrvSchema, stream
+
+
+APPSCHEMA = DrvSchema({
+    'User': {
+        'first_name': {
+            'type': 'string',
+            'required': True,
+            'maxlength': 5,
+        },
+        'last_name': {
+            'type': 'string',
+            'maxlength': 10,
+        },
+    }
+})
+
+
+class TestStream(unittest.TestCase):
+
+    def testNdjson(self):
+        """
+        Ensure NDJSON records are validated and rejects are written to the side file
+        """
+        fileobj = io.StringIO('{"first_name": "Aaron"}\n\n{"first_name": "Bartholomew"}\n{"last_name": "Kitzmiller"}\n')
+        rejects = io.StringIO()
+        stats = stream.StreamStats()
+
+        results = list(stream.validate(fileobj, 'User', APPSCHEMA, rejects=rejects, stats=stats))
+        self.assertTrue([errors for record, errors in results] == [{}, {'first_name': ['max length is 5']}, {'first_name': ['required field']}])
+        self.assertTrue(stats.records == 3 and stats.rejected == 2)
+        self.assertTrue(stats.recordsPerSecond > 0)
+
+        lines = rejects.getvalue().splitlines()
+        self.assertTrue(len(lines) == 2)
+        self.assertTrue(json.loads(lines[0])['record'] == {'first_name': 'Bartholomew'})
+
+    def testCsv(self):
+        """
+        Ensure empty CSV cells are treated as missing values
+        """
+        fileobj = io.StringIO('first_name,last_name\nAaron,Kitzmiller\n,Kitzmiller\n')
+        results = list(stream.validate(fileobj, 'User', APPSCHEMA, format='csv'))
+        self.assertTrue(results[0] == ({'first_name': 'Aaron', 'last_name': 'Kitzmiller'}, {}))
+        self.assertTrue(results[1][1] == {'first_name': ['required field']})
+
+    def testCsvTypes(self):
+        """
+        Ensure CSV cells are converted to the types of their fields and values
+        that cannot be converted fail the type rule
+        """
+        appschema = DrvSchema({
+            'Account': {
+                'name': {'type': 'string'},
+                'is_enabled': {'type': 'boolean'},
+                'logins': {'type': 'integer', 'min': 0},
+                'created': {'type': 'datetime'},
+            }
+        })
+        fileobj = io.StringIO(
+            'name,is_enabled,logins,created\n'
+            'bob,true,3,2020-01-01T00:00:00\n'
+            '007,False,-1,2020-01-01T00:00:00Z\n'
+            'eve,maybe,three,yesterday\n'
+        )
+        results = list(stream.validate(fileobj, 'Account', appschema, format='csv'))
+        self.assertTrue(results[0] == ({'name': 'bob', 'is_enabled': True, 'logins': 3, 'created': datetime(2020, 1, 1)}, {}))
+        self.assertTrue(results[1][0]['name'] == '007' and results[1][0]['is_enabled'] is False)
+        self.assertTrue(results[1][0]['created'] == datetime(2020, 1, 1, tzinfo=timezone.utc))
+        self.assertTrue(results[1][1] == {'logins': ['min value is 0']})
+        self.assertTrue(results[2][1] == {
+            'is_enabled': ['must be of boolean type'],
+            'logins': ['must be of integer type'],
+            'created': ['must be of datetime type'],
+        })
+
+        fileobj = io.StringIO('{"name": "bob", "logins": 3, "created": "2020-01-01T00:00:00"}\n')
+        self.assertTrue(list(stream.validate(fileobj, 'Account', appschema))[0][1] == {})
+
+    def testLazy(self):
+        """
+        Ensure records are read one at a time
+        """
+        lines = iter(['{"first_name": "Aaron"}\n'] * 3)
+        results = stream.validate(lines, 'User', APPSCHEMA)
+        next(results)
+        self.assertTrue(len(list(lines)) == 2)
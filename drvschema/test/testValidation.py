@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+'''
+testValidation
+
+Test for compiled record validators
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+import unittest
+from datetime import datetime
+from drvschema import DrvSchema
+
+try:
+    import cerberus
+except ImportError:
+    cerberus = None
+
+
+SCHEMATA = {
+    'User': {
+        'first_name': {
+            'type': 'string',
+            'required': True,
+            'maxlength': 10,
+            'empty': False,
+        },
+        'nickname': {
+            'type': 'string',
+            'nullable': True,
+            'maxlength': 5,
+        },
+        'is_enabled': {
+            'type': 'boolean',
+            'default': False,
+        },
+        'created': {
+            'type': 'datetime',
+            'readonly': True,
+        },
+        'age': {
+            'type': 'integer',
+            'min': 0,
+            'max': 150,
+        },
+        'role': {
+            'type': 'string',
+            'allowed': ['admin', 'user'],
+        },
+        'code': {
+            'type': 'string',
+            'regex': '[a-c]+',
+            'maxlength': 3,
+            'allowed': ['ab', 'abc'],
+        },
+    }
+}
+
+# Documents and the errors Cerberus reports for them
+CONFORMANCE = [
+    ({'first_name': 'Aaron'}, {}),
+    ({}, {'first_name': ['required field']}),
+    ({'first_name': 'Aaron', 'is_enabled': None}, {}),
+    ({'first_name': None}, {'first_name': ['null value not allowed']}),
+    ({'first_name': ''}, {'first_name': ['empty values not allowed']}),
+    ({'first_name': 'Bartholomew'}, {'first_name': ['max length is 10']}),
+    ({'first_name': 1}, {'first_name': ['must be of string type']}),
+    ({'first_name': 'Aaron', 'nickname': None}, {}),
+    ({'first_name': 'Aaron', 'nickname': 'Bartholomew'}, {'nickname': ['max length is 5']}),
+    ({'first_name': 'Aaron', 'is_enabled': 1}, {'is_enabled': ['must be of boolean type']}),
+    ({'first_name': 'Aaron', 'created': datetime(2018, 11, 27)}, {'created': ['field is read-only']}),
+    ({'first_name': 'Aaron', 'age': -1}, {'age': ['min value is 0']}),
+    ({'first_name': 'Aaron', 'age': 200}, {'age': ['max value is 150']}),
+    ({'first_name': 'Aaron', 'role': 'root'}, {'role': ['unallowed value root']}),
+    ({'first_name': 'Aaron', 'shoe_size': 9}, {'shoe_size': ['unknown field']}),
+    # Several errors for one field, in Cerberus's order
+    ({'first_name': 'Aaron', 'created': None}, {'created': ['null value not allowed', 'field is read-only']}),
+    ({'first_name': 'Aaron', 'code': 'abcd'}, {'code': ['unallowed value abcd', 'max length is 3', "value does not match regex '[a-c]+'"]}),
+]
+
+
+class TestValidation(unittest.TestCase):
+
+    def testConformance(self):
+        """
+        Ensure the compiled validator reports the same errors as Cerberus
+        """
+        validate = DrvSchema(SCHEMATA).compile_validator('User')
+        for document, expected in CONFORMANCE:
+            normalized, errors = validate(document)
+            self.assertTrue(errors == expected, '%s: %s != %s' % (document, errors, expected))
+
+        normalized, errors = validate({'first_name': 'Aaron'})
+        self.assertTrue(normalized['is_enabled'] is False)
+
+    @unittest.skipUnless(cerberus, 'Cerberus is not installed')
+    def testCerberusConformance(self):
+        """
+        Compare the compiled validator against Cerberus itself
+        """
+        validate = DrvSchema(SCHEMATA).compile_validator('User')
+        validator = cerberus.Validator(SCHEMATA['User'])
+        for document, expected in CONFORMANCE:
+            validator.validate(document)
+            self.assertTrue(validate(document)[1] == validator.errors, document)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+'''
+testViews
+
+Test for the cacheable Vuelidate validations endpoint
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+import unittest
+import gzip
+from drvschema import DrvSchema
+from drvschema.views import ValidationsCache, ValidationsView, parseAcceptEncoding
+
+try:
+    import django
+except ImportError:
+    django = None
+
+
+SCHEMATA = {
+    'User': {
+        'first_name': {
+            'type': 'string',
+            'required': True,
+            'maxlength': 200,
+        },
+    },
+    'Group': {
+        'name': {
+            'type': 'string',
+            'maxlength': 20,
+        },
+    },
+}
+
+
+class TestViews(unittest.TestCase):
+
+    def testRespond(self):
+        """
+        Ensure precomputed bodies are served with strong ETags, 304s and compressed variants
+        """
+        cache = ValidationsCache(DrvSchema(SCHEMATA))
+        status, headers, body = cache.respond('User')
+        self.assertTrue(status == 200)
+        self.assertTrue(b'export const User = {first_name: {required, maxLength: maxLength(200)}}' in body)
+        self.assertTrue(b'Group' not in body)
+        self.assertTrue(headers['Vary'] == 'Accept-Encoding' and 'Content-Encoding' not in headers)
+
+        status, gzipheaders, gzipbody = cache.respond('User', acceptencoding='deflate, gzip;q=0.8')
+        self.assertTrue(gzipheaders['Content-Encoding'] == 'gzip')
+        self.assertTrue(gzip.decompress(gzipbody) == body)
+        self.assertTrue(gzipheaders['ETag'] != headers['ETag'])
+        self.assertTrue(cache.get('User') is cache.get('User'))
+
+        status, notmodified, body = cache.respond('User', ifnonematch='"other", %s' % headers['ETag'])
+        self.assertTrue(status == 304 and body == b'')
+        self.assertTrue(cache.respond(None)[0] == 200)
+        self.assertTrue(b'export const Group' in cache.respond(None)[2])
+        with self.assertRaises(KeyError):
+            cache.respond('Nobody')
+
+        self.assertTrue(parseAcceptEncoding('gzip;q=0, br') == {'identity', 'br'})
+
+    @unittest.skipUnless(django, 'Django is not installed')
+    def testView(self):
+        """
+        Ensure the Django view maps the cache responses and unknown types to 404
+        """
+        from django.conf import settings
+        if not settings.configured:
+            settings.configure()
+        from django.http import Http404
+        from django.test import RequestFactory
+
+        view = ValidationsView(ValidationsCache(DrvSchema(SCHEMATA)))
+        factory = RequestFactory()
+        response = view(factory.get('/validations/User.js', HTTP_ACCEPT_ENCODING='gzip'), typename='User')
+        self.assertTrue(response.status_code == 200)
+        self.assertTrue(response['Content-Encoding'] == 'gzip')
+
+        response = view(factory.get('/validations/User.js', HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=response['ETag']), typename='User')
+        self.assertTrue(response.status_code == 304)
+        self.assertTrue(view(factory.post('/validations.js')).status_code == 405)
+        with self.assertRaises(Http404):
+            view(factory.get('/validations/Nobody.js'), typename='Nobody')
+
+
+if __name__ == '__main__':
+    unittest.main()
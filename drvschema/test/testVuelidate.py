@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+'''
+testVuelidate
+
+Test for the Vuelidate validations emitter
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+import unittest
+import io
+from drvschema import DrvSchema
+from drvschema.generate import Generator
+from drvschema.vuelidate import getImports, writeModule
+
+
+def emailValidator(field, value, error):
+    pass
+
+
+SCHEMATA = {
+    'User': {
+        'username': {
+            'type': 'string',
+            'required': True,
+            'minlength': 3,
+            'maxlength': 20,
+            'regex': '[a-z/]+',
+        },
+        'email': {
+            'type': 'string',
+            'validator': emailValidator,
+        },
+        'password': {
+            'type': 'string',
+        },
+        'confirm': {
+            'type': 'string',
+            'vuelidate': {'sameAs': ['password']},
+        },
+        'age': {
+            'type': 'integer',
+            'min': 0,
+            'max': 150,
+        },
+        'score': {
+            'type': 'float',
+            'min': 0.5,
+        },
+        'role': {
+            'type': 'string',
+            'allowed': ['admin', 'user'],
+        },
+    },
+    'Group': {
+        'name': {
+            'type': 'string',
+            'vuelidate': ['alpha'],
+        },
+    },
+}
+
+
+class TestVuelidate(unittest.TestCase):
+
+    def testRules(self):
+        """
+        Ensure Cerberus rules are emitted as Vuelidate validators without post-processing
+        """
+        appschema = DrvSchema(SCHEMATA)
+        self.assertTrue(appschema.to('VuelidateValidations', 'User') == (
+            '{username: {required, minLength: minLength(3), maxLength: maxLength(20), '
+            'regex: helpers.regex(\'regex\', new RegExp("^(?:[a-z/]+)$"))}, '
+            'email: {email}, '
+            'confirm: {sameAs: sameAs("password")}, '
+            'age: {between: between(0, 150)}, '
+            'score: {minValue: minValue(0.5)}, '
+            'role: {allowed: (value) => !helpers.req(value) || ["admin", "user"].includes(value)}}'
+        ))
+        self.assertTrue(getImports(appschema.index, 'User') == {
+            'required', 'minLength', 'maxLength', 'helpers', 'email', 'sameAs', 'between', 'minValue'
+        })
+
+        with self.assertRaises(Exception):
+            DrvSchema({'User': {'name': {'vuelidate': ['noSuchValidator']}}}).to('VuelidateValidations', 'User')
+
+    def testWriteModule(self):
+        """
+        Ensure the streamed module is the same as the generated JavaScript module
+        """
+        # Without the numeric fields, which have no Django field class
+        user = {field: schema for field, schema in SCHEMATA['User'].items() if 'min' not in schema}
+        appschema = DrvSchema({'User': user, 'Group': SCHEMATA['Group']})
+        stream = io.StringIO()
+        writeModule(appschema, stream)
+        self.assertTrue(stream.getvalue() == Generator(appschema).jsSource())
+        self.assertTrue("import { alpha, email, helpers, maxLength, minLength, required, sameAs } from 'vuelidate/lib/validators'\n" in stream.getvalue())
+        self.assertTrue('export const Group = {name: {alpha}}\n' in stream.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+
+'''
+drvschema.views
+
+Cacheable HTTP endpoint serving Vuelidate validations.
+
+Each type's validations, and the whole app's, are served as JavaScript modules
+(see drvschema.vuelidate.writeModule) that a frontend can load at runtime with
+import().  The body of each module is rendered once, together with its gzip
+and, when the brotli package is installed, brotli variants.  Responses carry a
+strong ETag from the sha256 of the body, so conditional requests get a 304 and
+CDNs and browsers can cache the responses.
+
+    # urls.py
+    from drvschema.views import getUrlPatterns
+
+    urlpatterns = [
+        path('schema/', include(getUrlPatterns(APPSCHEMA))),
+    ]
+
+serves schema/validations.js and schema/validations/<type>.js.  The
+ValidationsCache does not depend on Django.
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+import gzip
+import hashlib
+import io
+from drvschema.vuelidate import writeModule
+
+
+CONTENT_TYPE = 'text/javascript; charset=utf-8'
+
+# Content encodings in order of preference
+ENCODINGS = ('br', 'gzip', 'identity')
+
+
+def compressBrotli(body):
+    """
+    Return the brotli compressed body, or None if the brotli package is not installed
+    """
+    try:
+        import brotli
+    except ImportError:
+        return None
+
+    return brotli.compress(body)
+
+
+def parseAcceptEncoding(header):
+    """
+    Return the set of content codings an Accept-Encoding header allows
+    """
+    accepted = {'identity'}
+    rejected = set()
+    for item in (header or '').split(','):
+        parts = item.strip().split(';')
+        coding = parts[0].strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in parts[1:]:
+            name, _, value = param.strip().partition('=')
+            if name.strip() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(coding)
+        else:
+            rejected.add(coding)
+
+    if '*' in accepted:
+        accepted.update(ENCODINGS)
+    return accepted - rejected
+
+
+def etagMatches(header, etag):
+    """
+    True if an If-None-Match header matches the etag (weak comparison)
+    """
+    if not header:
+        return False
+    for candidate in header.split(','):
+        candidate = candidate.strip()
+        if candidate == '*' or candidate.replace('W/', '', 1) == etag:
+            return True
+
+    return False
+
+
+class Representation:
+    """
+    Precomputed body of a validations module and its compressed variants
+    """
+    def __init__(self, body):
+        digest = hashlib.sha256(body).hexdigest()
+        self.bodies = {'identity': body, 'gzip': gzip.compress(body, compresslevel=9, mtime=0)}
+        brotlibody = compressBrotli(body)
+        if brotlibody is not None:
+            self.bodies['br'] = brotlibody
+        # Each encoding is a different representation, so each gets its own strong ETag
+        self.etags = {
+            encoding: '"%s"' % digest if encoding == 'identity' else '"%s-%s"' % (digest, encoding)
+            for encoding in self.bodies
+        }
+
+    def getEncoding(self, acceptencoding):
+        """
+        Return the preferred available encoding for an Accept-Encoding header,
+        falling back to identity
+        """
+        accepted = parseAcceptEncoding(acceptencoding)
+        for encoding in ENCODINGS:
+            if encoding in self.bodies and encoding in accepted:
+                return encoding
+        return 'identity'
+
+
+class ValidationsCache:
+    """
+    Precomputed validations modules of a DrvSchema keyed by type name, with None
+    for the whole app module
+    """
+    def __init__(self, appschema, max_age=300):
+        self.appschema = appschema
+        self.max_age = max_age
+        self.representations = {}
+
+    def render(self, typename=None):
+        """
+        Render the module of one type, or of every type if typename is None
+        """
+        stream = io.StringIO()
+        writeModule(self.appschema, stream, typenames=None if typename is None else [typename])
+        return stream.getvalue().encode('utf-8')
+
+    def get(self, typename=None):
+        """
+        Return the Representation of a type's module, rendering it the first time.
+        Raises KeyError for unknown types.
+        """
+        representation = self.representations.get(typename)
+        if representation is None:
+            if typename is not None and typename not in self.appschema.schemata:
+                raise KeyError(typename)
+            representation = self.representations[typename] = Representation(self.render(typename))
+
+        return representation
+
+    def precompute(self):
+        """
+        Render every module up front, e.g. before forking server workers
+        """
+        self.get()
+        for typename in self.appschema.schemata:
+            self.get(typename)
+
+    def clear(self):
+        """
+        Drop the rendered modules, e.g. after the DrvSchema is invalidated
+        """
+        self.representations = {}
+
+    def respond(self, typename=None, acceptencoding=None, ifnonematch=None):
+        """
+        Return (status, headers, body) for a request of a type's module.
+        Raises KeyError for unknown types.
+        """
+        representation = self.get(typename)
+        encoding = representation.getEncoding(acceptencoding)
+        headers = {
+            'ETag': representation.etags[encoding],
+            'Vary': 'Accept-Encoding',
+            'Cache-Control': 'public, max-age=%d' % self.max_age,
+        }
+        if etagMatches(ifnonematch, headers['ETag']):
+            return 304, headers, b''
+
+        headers['Content-Type'] = CONTENT_TYPE
+        if encoding != 'identity':
+            headers['Content-Encoding'] = encoding
+        return 200, headers, representation.bodies[encoding]
+
+
+class ValidationsView:
+    """
+    Django view serving the validations modules of a ValidationsCache
+    """
+    def __init__(self, cache):
+        self.cache = cache
+
+    def __call__(self, request, typename=None):
+        from django.http import Http404, HttpResponse, HttpResponseNotAllowed
+
+        if request.method not in ('GET', 'HEAD'):
+            return HttpResponseNotAllowed(['GET', 'HEAD'])
+        try:
+            status, headers, body = self.cache.respond(
+                typename,
+                acceptencoding=request.META.get('HTTP_ACCEPT_ENCODING'),
+                ifnonematch=request.META.get('HTTP_IF_NONE_MATCH'),
+            )
+        except KeyError:
+            raise Http404('No validations for type %s' % typename)
+
+        response = HttpResponse(body if request.method == 'GET' else b'', status=status)
+        if status == 304:
+            del response['Content-Type']
+        for name, value in headers.items():
+            response[name] = value
+        if status == 200:
+            response['Content-Length'] = str(len(body))
+        return response
+
+
+def getUrlPatterns(appschema, max_age=300, precompute=False):
+    """
+    Return the URL patterns serving validations.js and validations/<type>.js for a DrvSchema
+    """
+    from django.urls import path
+
+    cache = ValidationsCache(appschema, max_age=max_age)
+    if precompute:
+        cache.precompute()
+    view = ValidationsView(cache)
+
+    return [
+        path('validations.js', view, name='drvschema-validations'),
+        path('validations/<str:typename>.js', view, name='drvschema-type-validations'),
+    ]
@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+
+'''
+drvschema.vuelidate
+
+Vuelidate validations emitter.
+
+Field schemata are turned into JavaScript object literals of Vuelidate validators
+that are written directly to a stream, one field at a time.
+
+    required: true              required
+    minlength / maxlength       minLength(n) / maxLength(n)
+    min and / or max            between(min, max), minValue(min) or maxValue(max)
+    regex                       helpers.regex('regex', new RegExp('^(?:...)$'))
+    allowed                     a function checking that the value is one of the allowed values
+
+A Cerberus validator function named after a Vuelidate built-in, with or without
+a Validator suffix (e.g. emailValidator), is emitted as that built-in.  Other
+Vuelidate validators such as url or sameAs have no Cerberus equivalent, so they
+are set with a vuelidate entry in the field schema, either a list of validator
+names or a dictionary of validator name to argument list
+
+    'email': {'type': 'string', 'vuelidate': ['email']},
+    'confirm': {'type': 'string', 'vuelidate': {'sameAs': ['password']}},
+
+Dict fields with nested fields get nested validation objects and lists of dicts
+get a $each object for their items.  A whole app module can be written to a file
+with writeModule without building the module in memory.
+
+    with open('validations.js', 'w') as f:
+        writeModule(APPSCHEMA, f)
+
+Created on  2026-10-18
+
+@author: agent <agent@local>
+@copyright: 2026 The Presidents and Fellows of Harvard College.
+All rights reserved.
+@license: GPL v2.0
+'''
+import io
+import json
+import re
+from drvschema import converter
+from drvschema.fieldspec import MISSING
+
+
+IMPORT_SOURCE = 'vuelidate/lib/validators'
+
+# Vuelidate built-in validators that can be set with the vuelidate schema entry
+BUILTINS = {
+    'required', 'requiredIf', 'requiredUnless', 'minLength', 'maxLength', 'minValue', 'maxValue',
+    'between', 'alpha', 'alphaNum', 'numeric', 'integer', 'decimal', 'email', 'ipAddress',
+    'macAddress', 'sameAs', 'url', 'not', 'or', 'and',
+}
+
+ALLOWED = "(value) => !helpers.req(value) || %s.includes(value)"
+ALLOWED_EACH = "(value) => !helpers.req(value) || value.every((item) => %s.includes(item))"
+
+IDENTIFIER = re.compile(r'^[A-Za-z_$][A-Za-z0-9_$]*$')
+
+
+def jsLiteral(value):
+    """
+    Return the JavaScript source for a JSON-like value
+    """
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, (int, float, str)):
+        return json.dumps(value)
+    if isinstance(value, (list, tuple)):
+        return '[%s]' % ', '.join(jsLiteral(item) for item in value)
+    if isinstance(value, dict):
+        return '{%s}' % ', '.join('%s: %s' % (jsKey(key), jsLiteral(item)) for key, item in value.items())
+
+    raise Exception('Value %r cannot be written as a JavaScript literal' % (value,))
+
+
+def jsKey(key):
+    """
+    Return an object literal key, quoted unless it is an identifier
+    """
+    return key if IDENTIFIER.match(key) else json.dumps(key)
+
+
+def getFieldValidators(spec):
+    """
+    Return a list of (key, expression, import name) of the Vuelidate validators for a
+    FieldSpec.  expression is None for validators that are used as is (e.g. required).
+    """
+    validators = []
+    if spec.required:
+        validators.append(('required', None, 'required'))
+    if spec.minlength is not MISSING:
+        validators.append(('minLength', 'minLength(%s)' % jsLiteral(spec.minlength), 'minLength'))
+    if spec.maxlength is not MISSING:
+        validators.append(('maxLength', 'maxLength(%s)' % jsLiteral(spec.maxlength), 'maxLength'))
+
+    minimum = spec.min if converter.isNumber(spec.min) else None
+    maximum = spec.max if converter.isNumber(spec.max) else None
+    if minimum is not None and maximum is not None:
+        validators.append(('between', 'between(%s, %s)' % (jsLiteral(minimum), jsLiteral(maximum)), 'between'))
+    elif minimum is not None:
+        validators.append(('minValue', 'minValue(%s)' % jsLiteral(minimum), 'minValue'))
+    elif maximum is not None:
+        validators.append(('maxValue', 'maxValue(%s)' % jsLiteral(maximum), 'maxValue'))
+
+    if spec.regex is not MISSING:
+        # Cerberus regexes must match the whole value
+        pattern = jsLiteral('^(?:%s)$' % spec.regex)
+        validators.append(('regex', "helpers.regex('regex', new RegExp(%s))" % pattern, 'helpers'))
+    if spec.allowed is not MISSING:
+        template = ALLOWED_EACH if spec.type == 'list' else ALLOWED
+        validators.append(('allowed', template % jsLiteral(list(spec.allowed)), 'helpers'))
+
+    validator = spec.get('validator')
+    for func in validator if isinstance(validator, (list, tuple)) else [validator]:
+        name = re.sub('Validator$', '', getattr(func, '__name__', ''))
+        if name in BUILTINS:
+            validators.append((name, None, name))
+
+    extra = spec.get('vuelidate', ())
+    if isinstance(extra, str):
+        extra = [extra]
+    for name in extra:
+        if name not in BUILTINS:
+            raise Exception('%s is not a Vuelidate built-in validator' % name)
+        if isinstance(extra, dict) and extra[name] is not None:
+            validators.append((name, '%s(%s)' % (name, ', '.join(jsLiteral(arg) for arg in extra[name])), name))
+        else:
+            validators.append((name, None, name))
+
+    return validators
+
+
+def iterFieldObjects(schemata, keystr, imports=None):
+    """
+    Yield (field, JavaScript object literal) for each field of a type or nested dict
+    field key string that has validators.  The names to import are added to imports.
+    """
+    for field, spec in converter.getFieldSpecs(schemata, keystr):
+        entries = []
+        for key, expression, name in getFieldValidators(spec):
+            entries.append(key if expression is None else '%s: %s' % (key, expression))
+            if imports is not None:
+                imports.add(name)
+
+        path = '%s.%s' % (keystr, field)
+        if converter.getNestedFields(spec.rules) is not None:
+            entries.extend('%s: %s' % (jsKey(name), literal) for name, literal in iterFieldObjects(schemata, path, imports))
+        elif spec.type == 'list':
+            items = converter.getItemsSchema(spec.rules)
+            if items is not None and converter.getNestedFields(items) is not None:
+                each = ['%s: %s' % (jsKey(name), literal) for name, literal in iterFieldObjects(schemata, '%s.%s' % (path, converter.ITEMS_KEY), imports)]
+                if each:
+                    entries.append('$each: {%s}' % ', '.join(each))
+
+        if entries:
+            yield field, '{%s}' % ', '.join(entries)
+
+
+def writeValidations(stream, schemata, keystr, imports=None):
+    """
+    Write the validations object literal of a type or nested dict field key string to a stream
+    """
+    stream.write('{')
+    separator = ''
+    for field, literal in iterFieldObjects(schemata, keystr, imports):
+        stream.write('%s%s: %s' % (separator, jsKey(field), literal))
+        separator = ', '
+    stream.write('}')
+
+
+def getValidations(schemata, keystr, imports=None):
+    """
+    Return the validations object literal of a type or nested dict field key string
+    """
+    stream = io.StringIO()
+    writeValidations(stream, schemata, keystr, imports)
+    return stream.getvalue()
+
+
+def getImports(schemata, keystr):
+    """
+    Return the set of names a type or nested dict field's validations import
+    """
+    imports = set()
+    for item in iterFieldObjects(schemata, keystr, imports):
+        pass
+
+    return imports
+
+
+def importLine(imports):
+    """
+    Return the import statement for a set of names
+    """
+    return "import { %s } from '%s'\n" % (', '.join(sorted(imports)), IMPORT_SOURCE)
+
+
+def writeModule(appschema, stream, typenames=None):
+    """
+    Write a JavaScript module exporting the validations of every type (or of typenames)
+    of a DrvSchema to a stream, one type at a time
+    """
+    if typenames is None:
+        typenames = list(appschema.schemata)
+
+    imports = set()
+    for typename in typenames:
+        imports.update(getImports(appschema.index, typename))
+
+    stream.write('// Generated by drvschema.  Do not edit.\n')
+    if imports:
+        stream.write(importLine(imports))
+    stream.write('\n')
+    for typename in typenames:
+        stream.write('export const %s = ' % typename)
+        writeValidations(stream, appschema.index, typename)
+        stream.write('\n')